@@ -1,5 +1,6 @@
 # polling_results/models.py
 from django.db import models
+from django.db.models.functions import Upper
 
 class State(models.Model):
     state_id = models.IntegerField(primary_key=True)
@@ -13,6 +14,11 @@ class LGA(models.Model):
     lga_name = models.CharField(max_length=100)
     state = models.ForeignKey(State, on_delete=models.CASCADE)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['state', 'lga_id'], name='lga_state_idx'),
+        ]
+    
     def __str__(self):
         return self.lga_name
 
@@ -21,6 +27,12 @@ class Ward(models.Model):
     ward_name = models.CharField(max_length=100)
     lga = models.ForeignKey(LGA, on_delete=models.CASCADE)
     
+    class Meta:
+        indexes = [
+            # Walk from an LGA to its wards without touching the ward rows
+            models.Index(fields=['lga', 'ward_id'], name='ward_lga_idx'),
+        ]
+    
     def __str__(self):
         return self.ward_name
 
@@ -28,6 +40,20 @@ class PollingUnit(models.Model):
     polling_unit_id = models.IntegerField(primary_key=True)
     polling_unit_name = models.CharField(max_length=100)
     ward = models.ForeignKey(Ward, on_delete=models.CASCADE)
+    # Case-insensitive name prefix search runs as a plain startswith on this
+    # column; on PostgreSQL db_index adds the pattern_ops index LIKE needs
+    search_name = models.GeneratedField(
+        expression=Upper('polling_unit_name'),
+        output_field=models.CharField(max_length=100),
+        db_persist=True,
+        db_index=True,
+    )
+    
+    class Meta:
+        indexes = [
+            # Keyset pages of the units in one ward
+            models.Index(fields=['ward', 'polling_unit_id'], name='pu_ward_keyset_idx'),
+        ]
     
     def __str__(self):
         return self.polling_unit_name
@@ -47,6 +73,10 @@ class AnnouncedPuResult(models.Model):
     
     class Meta:
         unique_together = ('polling_unit', 'party')
+        indexes = [
+            # Covers the per-party sums over a set of polling units
+            models.Index(fields=['polling_unit', 'party', 'party_score'], name='pu_result_covering_idx'),
+        ]
     
     def __str__(self):
         return f"{self.polling_unit} - {self.party}: {self.party_score}"
@@ -59,59 +89,1261 @@ class AnnouncedLgaResult(models.Model):
     
     class Meta:
         unique_together = ('lga', 'party')
+        indexes = [
+            models.Index(fields=['lga', 'party', 'party_score'], name='lga_result_covering_idx'),
+        ]
     
     def __str__(self):
         return f"{self.lga} - {self.party}: {self.party_score}"
 
+# Rollups of AnnouncedPuResult, kept up to date by polling_results/rollups.py
+class WardResultRollup(models.Model):
+    ward = models.ForeignKey(Ward, on_delete=models.CASCADE)
+    party = models.ForeignKey(Party, on_delete=models.CASCADE)
+    total_score = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('ward', 'party')
+
+    def __str__(self):
+        return f"{self.ward} - {self.party}: {self.total_score}"
+
+class LgaResultRollup(models.Model):
+    lga = models.ForeignKey(LGA, on_delete=models.CASCADE)
+    party = models.ForeignKey(Party, on_delete=models.CASCADE)
+    total_score = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('lga', 'party')
+
+    def __str__(self):
+        return f"{self.lga} - {self.party}: {self.total_score}"
+
+class StateResultRollup(models.Model):
+    state = models.ForeignKey(State, on_delete=models.CASCADE)
+    party = models.ForeignKey(Party, on_delete=models.CASCADE)
+    total_score = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('state', 'party')
+
+    def __str__(self):
+        return f"{self.state} - {self.party}: {self.total_score}"
+
+# Differences between announced LGA totals and the sum of their polling units
+class LgaDiscrepancy(models.Model):
+    lga = models.ForeignKey(LGA, on_delete=models.CASCADE)
+    party = models.ForeignKey(Party, on_delete=models.CASCADE)
+    announced_score = models.BigIntegerField(null=True)
+    computed_score = models.BigIntegerField(null=True)
+    checked_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('lga', 'party')
+
+    def __str__(self):
+        return f"{self.lga} - {self.party}: announced {self.announced_score}, computed {self.computed_score}"
+
+# LGAs whose results changed since they were last reconciled
+class LgaRecheck(models.Model):
+    lga = models.OneToOneField(LGA, on_delete=models.CASCADE, primary_key=True)
+
+    def __str__(self):
+        return str(self.lga)
+
+# Hands out blocks of primary keys for tables with caller-assigned ids
+class IdSequence(models.Model):
+    name = models.CharField(max_length=100, primary_key=True)
+    next_value = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.name}: {self.next_value}"
+
+# polling_results/apps.py
+from django.apps import AppConfig
+
+class PollingResultsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'polling_results'
+
+    def ready(self):
+        # Connect the signal handlers that keep the party registry, rollups,
+        # cache, reconciliation queue and live subscribers in step
+        from . import parties, rollups, cache, reconciliation, live  # noqa: F401
+
+# polling_results/parties.py
+# Parties rarely change, so each process keeps them in memory. A version key in
+# the results cache, bumped whenever a Party is saved or deleted, tells every
+# process to reload; with a per-process cache the TTL bounds how stale they get.
+import threading
+import time
+from django import forms
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Party
+from .cache import PARTY_VERSION, current_version, invalidate
+
+PARTY_REGISTRY_TTL = getattr(settings, 'POLLING_RESULTS_PARTY_TTL', 60)
+
+_lock = threading.Lock()
+# (cache version, monotonic load time, parties, score fields)
+_registry = None
+
+def _is_current(registry, version):
+    return (
+        registry is not None
+        and registry[0] == version
+        and time.monotonic() - registry[1] < PARTY_REGISTRY_TTL
+    )
+
+def _load():
+    global _registry
+    version = current_version(*PARTY_VERSION)
+    registry = _registry
+    if _is_current(registry, version):
+        return registry
+    with _lock:
+        if not _is_current(_registry, version):
+            parties = tuple(Party.objects.order_by('party_id'))
+            score_fields = {
+                f'party_{party.party_id}': forms.IntegerField(
+                    label=f'{party.party_name} Score',
+                    min_value=0,
+                    initial=0
+                )
+                for party in parties
+            }
+            _registry = (version, time.monotonic(), parties, score_fields)
+        return _registry
+
+def get_parties():
+    """All parties, ordered by id."""
+    return _load()[2]
+
+def get_party_ids():
+    return {party.party_id for party in get_parties()}
+
+def get_party_lookup():
+    """party_name -> party_id"""
+    return {party.party_name: party.party_id for party in get_parties()}
+
+def party_score_fields():
+    """Score field definitions for NewResultForm; copy them before binding to a form."""
+    return _load()[3]
+
+def invalidate_parties():
+    """Make every process reload the parties on its next lookup."""
+    global _registry
+    invalidate(*PARTY_VERSION)
+    with _lock:
+        _registry = None
+
+@receiver(post_save, sender=Party)
+@receiver(post_delete, sender=Party)
+def reload_parties(sender, **kwargs):
+    invalidate_parties()
+
+# polling_results/rollups.py
+from collections import defaultdict
+from django.db import connection, transaction
+from django.db.models import QuerySet, Sum
+from django.db.models.signals import post_init, pre_save, post_save, pre_delete, post_delete
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+from .models import (
+    State, LGA, Ward, PollingUnit, Party, AnnouncedPuResult,
+    WardResultRollup, LgaResultRollup, StateResultRollup,
+)
+
+# Sent once the change is committed (both single saves and bulk inserts) with
+# polling_unit_ids, lga_ids and state_ids whose results moved, and the score changes as
+# unit_deltas {(polling_unit_id, party_id): delta} and lga_deltas {(lga_id, party_id): delta}
+results_changed = Signal()
+
+# (level name, rollup model, key field on the rollup, path to the key from AnnouncedPuResult)
+ROLLUP_LEVELS = (
+    ('ward', WardResultRollup, 'ward_id', 'polling_unit__ward_id'),
+    ('lga', LgaResultRollup, 'lga_id', 'polling_unit__ward__lga_id'),
+    ('state', StateResultRollup, 'state_id', 'polling_unit__ward__lga__state_id'),
+)
+
+# Rows per INSERT, kept well under SQLite's limit of 999 parameters per statement
+UPSERT_BATCH_ROWS = 200
+
+def _upsert_totals(model, key_field, changes):
+    """
+    Add every delta in changes {(key, party_id): delta} to its rollup row with
+    one INSERT ... ON CONFLICT DO UPDATE per batch, creating missing rows and
+    stamping updated_at. Rows are written in key order so concurrent batches
+    lock them in the same order.
+    """
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    key_column = quote(model._meta.get_field(key_field).column)
+    party_column = quote(model._meta.get_field('party').column)
+    score_column = quote('total_score')
+    updated_column = quote('updated_at')
+    now = connection.ops.adapt_datetimefield_value(timezone.now())
+    rows = sorted(changes.items())
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), UPSERT_BATCH_ROWS):
+            batch = rows[start:start + UPSERT_BATCH_ROWS]
+            cursor.execute(
+                f"INSERT INTO {table} ({key_column}, {party_column}, {score_column}, {updated_column}) "
+                f"VALUES {', '.join(['(%s, %s, %s, %s)'] * len(batch))} "
+                f"ON CONFLICT ({key_column}, {party_column}) "
+                f"DO UPDATE SET {score_column} = {table}.{score_column} + EXCLUDED.{score_column}, "
+                f"{updated_column} = EXCLUDED.{updated_column}",
+                [value for (key, party_id), delta in batch for value in (key, party_id, delta, now)],
+            )
+
+def apply_result_deltas(deltas, skip_levels=()):
+    """
+    Apply score changes to every rollup level except those named in skip_levels.
+    deltas maps (polling_unit_id, party_id) to the change in party_score.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    # One query resolves the ward, LGA and state of every touched polling unit
+    unit_ids = {unit_id for unit_id, _ in deltas}
+    parents = {
+        row[0]: row[1:]
+        for row in PollingUnit.objects.filter(pk__in=unit_ids).values_list(
+            'polling_unit_id', 'ward_id', 'ward__lga_id', 'ward__lga__state_id'
+        )
+    }
+
+    level_deltas = [defaultdict(int) for _ in ROLLUP_LEVELS]
+    for (unit_id, party_id), delta in deltas.items():
+        if unit_id not in parents:
+            continue  # Polling unit is already gone
+        for level, key in enumerate(parents[unit_id]):
+            level_deltas[level][(key, party_id)] += delta
+
+    # One upsert statement per level (and per UPSERT_BATCH_ROWS pairs). Pairs
+    # that net to zero are still written so their updated_at moves: a state
+    # total can stay put while the LGA totals under it change.
+    with transaction.atomic():
+        for (name, model, key_field, _), changes in zip(ROLLUP_LEVELS, level_deltas):
+            if changes and name not in skip_levels:
+                _upsert_totals(model, key_field, changes)
+
+    lga_ids = {lga_id for _, lga_id, _ in parents.values()}
+    state_ids = {state_id for _, _, state_id in parents.values()}
+    lga_deltas = {key: delta for key, delta in level_deltas[1].items() if delta}
+    transaction.on_commit(lambda: results_changed.send(
+        sender=AnnouncedPuResult, polling_unit_ids=unit_ids, lga_ids=lga_ids, state_ids=state_ids,
+        unit_deltas=deltas, lga_deltas=lga_deltas,
+    ))
+
+def _compute_rollups():
+    """Full recomputation of every rollup level from AnnouncedPuResult."""
+    computed = {}
+    for name, _, _, path in ROLLUP_LEVELS:
+        rows = AnnouncedPuResult.objects.values_list(path, 'party_id').annotate(
+            total=Sum('party_score')
+        ).order_by()
+        computed[name] = {(key, party_id): total for key, party_id, total in rows}
+    return computed
+
+def rebuild_rollups():
+    """Throw away the rollup tables and rebuild them from scratch."""
+    computed = _compute_rollups()
+    with transaction.atomic():
+        for name, model, key_field, _ in ROLLUP_LEVELS:
+            model.objects.all().delete()
+            model.objects.bulk_create(
+                [
+                    model(total_score=total, party_id=party_id, **{key_field: key})
+                    for (key, party_id), total in computed[name].items()
+                ],
+                batch_size=1000,
+            )
+
+def verify_rollups():
+    """
+    Compare the stored rollups with a full recomputation.
+    Returns a list of (level, key, party_id, stored, expected) mismatches.
+    """
+    computed = _compute_rollups()
+    mismatches = []
+    for name, model, key_field, _ in ROLLUP_LEVELS:
+        expected = computed[name]
+        stored = {
+            (key, party_id): total
+            for key, party_id, total in model.objects.values_list(key_field, 'party_id', 'total_score')
+        }
+        for key in sorted(expected.keys() | stored.keys()):
+            # A zero row left behind by deleted results matches a missing one
+            if stored.get(key, 0) != expected.get(key, 0):
+                mismatches.append((name, key[0], key[1], stored.get(key), expected.get(key)))
+    return mismatches
+
+# Remember the values a result was loaded with, so saves can apply only the change
+SNAPSHOT_FIELDS = ('polling_unit_id', 'party_id', 'party_score')
+
+def _result_snapshot(result):
+    # Read __dict__ directly: touching a deferred field would reload it, one query per row
+    values = result.__dict__
+    if any(field not in values for field in SNAPSHOT_FIELDS):
+        return None
+    return tuple(values[field] for field in SNAPSHOT_FIELDS)
+
+def _stored_snapshot(result):
+    return AnnouncedPuResult.objects.filter(pk=result.pk).values_list(*SNAPSHOT_FIELDS).first()
+
+@receiver(post_init, sender=AnnouncedPuResult)
+def remember_loaded_result(sender, instance, **kwargs):
+    instance._rollup_snapshot = _result_snapshot(instance) if instance.pk else None
+
+@receiver(pre_save, sender=AnnouncedPuResult)
+@receiver(pre_delete, sender=AnnouncedPuResult)
+def remember_deferred_result(sender, instance, raw=False, **kwargs):
+    # Loaded with deferred fields: read the stored values once, before they change
+    if raw or instance._state.adding or getattr(instance, '_rollup_snapshot', None) is not None:
+        return
+    instance._rollup_snapshot = _stored_snapshot(instance)
+
+@receiver(post_save, sender=AnnouncedPuResult)
+def rollup_saved_result(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return  # Fixture loading; run rebuild_rollups afterwards
+    deltas = defaultdict(int)
+    previous = None if created else getattr(instance, '_rollup_snapshot', None)
+    if previous:
+        deltas[previous[:2]] -= previous[2]
+    # A save of a deferred instance leaves the deferred fields as they were stored
+    current = _result_snapshot(instance) or _stored_snapshot(instance)
+    deltas[current[:2]] += current[2]
+    apply_result_deltas(deltas)
+    instance._rollup_snapshot = current
+
+def origin_model(origin):
+    """Model whose delete() started a cascade (post_delete's origin), or None."""
+    if origin is None:
+        return None
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+# Rollup levels whose rows are removed by the same cascade as the results, so
+# writing deltas to them would re-create rows pointing at deleted parents
+CASCADE_SKIPPED_LEVELS = {
+    Ward: ('ward',),
+    LGA: ('ward', 'lga'),
+    State: ('ward', 'lga', 'state'),
+    Party: ('ward', 'lga', 'state'),
+}
+
+@receiver(post_delete, sender=AnnouncedPuResult)
+def rollup_deleted_result(sender, instance, origin=None, **kwargs):
+    skip_levels = CASCADE_SKIPPED_LEVELS.get(origin_model(origin), ())
+    if len(skip_levels) == len(ROLLUP_LEVELS):
+        return
+    unit_id, party_id, score = getattr(instance, '_rollup_snapshot', None) or _result_snapshot(instance)
+    apply_result_deltas({(unit_id, party_id): -score}, skip_levels)
+
+# The state dashboard shows state, LGA and party names, and takes its ETag from
+# the newest updated_at of the state's rollup rows, so renames move it as well
+@receiver(post_save, sender=State)
+@receiver(post_save, sender=LGA)
+@receiver(post_delete, sender=LGA)
+def touch_renamed_state(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    state_id = instance.pk if sender is State else instance.state_id
+    StateResultRollup.objects.filter(state_id=state_id).update(updated_at=timezone.now())
+
+@receiver(post_save, sender=Party)
+@receiver(post_delete, sender=Party)
+def touch_all_states(sender, raw=False, **kwargs):
+    # Every dashboard lists every party
+    if raw:
+        return
+    StateResultRollup.objects.update(updated_at=timezone.now())
+
+# polling_results/cache.py
+import threading
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from .models import LGA, PollingUnit
+from .rollups import results_changed
+
+# Django's default cache is local memory unless the project configures another
+RESULTS_CACHE_ALIAS = getattr(settings, 'POLLING_RESULTS_CACHE', 'default')
+RESULTS_CACHE_TIMEOUT = getattr(settings, 'POLLING_RESULTS_CACHE_TIMEOUT', 300)
+
+_MISSING = object()
+# Bumped by polling_results.parties whenever a Party is saved or deleted
+PARTY_VERSION = ('parties', 'all')
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+def _cache():
+    return caches[RESULTS_CACHE_ALIAS]
+
+def _version_key(kind, object_id):
+    return f'results:{kind}:{object_id}:version'
+
+def _fresh_version():
+    # Never reuse an old version number after the version key is evicted
+    return time.time_ns()
+
+def current_version(kind, object_id):
+    """Version number of kind/object_id; it changes whenever invalidate() is called."""
+    return _cache().get_or_set(_version_key(kind, object_id), _fresh_version, None)
+
+def invalidate(kind, object_id):
+    """Move kind/object_id to a new version so older cache entries are never read again."""
+    key = _version_key(kind, object_id)
+    try:
+        _cache().incr(key)
+    except ValueError:
+        _cache().set(key, _fresh_version(), None)
+
+def _versions(*pairs):
+    # One round trip for the usual case where every version key is present
+    keys = [_version_key(kind, object_id) for kind, object_id in pairs]
+    found = _cache().get_many(keys)
+    return [found[key] if key in found else current_version(*pair) for key, pair in zip(keys, pairs)]
+
+def get_or_compute(kind, object_id, compute):
+    """
+    Return the cached value for kind/object_id, computing and storing it on a miss.
+    Cached pages show party names, so a party change also moves the key.
+    """
+    version, party_version = _versions((kind, object_id), PARTY_VERSION)
+    key = f'results:{kind}:{object_id}:v{version}:p{party_version}'
+    value = _cache().get(key, _MISSING)
+    with _stats_lock:
+        _stats['misses' if value is _MISSING else 'hits'] += 1
+    if value is _MISSING:
+        value = compute()
+        _cache().set(key, value, RESULTS_CACHE_TIMEOUT)
+    return value
+
+def cache_stats():
+    """Hit/miss counters for this process."""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+    return stats
+
+def reset_cache_stats():
+    with _stats_lock:
+        _stats['hits'] = _stats['misses'] = 0
+
+@receiver(results_changed)
+def invalidate_changed_results(sender, polling_unit_ids, lga_ids, **kwargs):
+    for polling_unit_id in polling_unit_ids:
+        invalidate('polling_unit', polling_unit_id)
+    for lga_id in lga_ids:
+        invalidate('lga', lga_id)
+
+@receiver(post_save, sender=LGA)
+def invalidate_renamed_lga(sender, instance, **kwargs):
+    invalidate('lga', instance.pk)
+
+@receiver(post_save, sender=PollingUnit)
+def invalidate_renamed_polling_unit(sender, instance, **kwargs):
+    invalidate('polling_unit', instance.pk)
+
+# polling_results/reconciliation.py
+from django.db import transaction
+from django.db.models import Sum
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import LGA, State, AnnouncedPuResult, AnnouncedLgaResult, LgaDiscrepancy, LgaRecheck
+from .rollups import origin_model, results_changed
+
+def reconcile_lgas(lga_ids=None):
+    """
+    Compare announced LGA totals with the sum of their polling unit results
+    for the given LGAs (every LGA when lga_ids is None) and store the
+    differences. Each side is one grouped query, whatever the number of LGAs.
+    Returns the number of discrepancies found.
+    """
+    computed_rows = AnnouncedPuResult.objects.values_list('polling_unit__ward__lga_id', 'party_id')
+    announced_rows = AnnouncedLgaResult.objects.values_list('lga_id', 'party_id', 'party_score')
+    stale = LgaDiscrepancy.objects.all()
+    if lga_ids is not None:
+        lga_ids = list(lga_ids)
+        computed_rows = computed_rows.filter(polling_unit__ward__lga_id__in=lga_ids)
+        announced_rows = announced_rows.filter(lga_id__in=lga_ids)
+        stale = stale.filter(lga_id__in=lga_ids)
+
+    computed = {
+        (lga_id, party_id): total
+        for lga_id, party_id, total in computed_rows.annotate(total=Sum('party_score')).order_by()
+    }
+    announced = {(lga_id, party_id): score for lga_id, party_id, score in announced_rows}
+
+    discrepancies = [
+        LgaDiscrepancy(
+            lga_id=lga_id, party_id=party_id,
+            announced_score=announced.get((lga_id, party_id)),
+            computed_score=computed.get((lga_id, party_id)),
+        )
+        for lga_id, party_id in sorted(computed.keys() | announced.keys())
+        if announced.get((lga_id, party_id), 0) != computed.get((lga_id, party_id), 0)
+    ]
+    with transaction.atomic():
+        stale.delete()
+        LgaDiscrepancy.objects.bulk_create(discrepancies, batch_size=1000)
+    return len(discrepancies)
+
+def reconcile_all_lgas():
+    """National sweep; also clears the queue of LGAs waiting for a recheck."""
+    with transaction.atomic():
+        LgaRecheck.objects.all().delete()
+        return reconcile_lgas()
+
+def reconcile_pending_lgas():
+    """
+    Recheck only the LGAs whose results changed since the last run.
+    The queue rows are claimed and removed in the same transaction as the
+    recheck, so a failed run leaves them queued; concurrent runs skip rows
+    another run has claimed.
+    """
+    with transaction.atomic():
+        lga_ids = list(LgaRecheck.objects.select_for_update(skip_locked=True).values_list('lga_id', flat=True))
+        if not lga_ids:
+            return 0
+        # Changes that arrive while we run queue their LGA again for the next run
+        LgaRecheck.objects.filter(lga_id__in=lga_ids).delete()
+        return reconcile_lgas(lga_ids)
+
+def queue_lga_rechecks(lga_ids):
+    # LGAs deleted since the change was made have nothing left to recheck
+    existing = LGA.objects.filter(pk__in=list(lga_ids)).values_list('pk', flat=True)
+    LgaRecheck.objects.bulk_create(
+        [LgaRecheck(lga_id=lga_id) for lga_id in existing], ignore_conflicts=True
+    )
+
+@receiver(results_changed)
+def queue_changed_lgas(sender, lga_ids, **kwargs):
+    queue_lga_rechecks(lga_ids)
+
+@receiver(post_save, sender=AnnouncedLgaResult)
+@receiver(post_delete, sender=AnnouncedLgaResult)
+def queue_announced_lga(sender, instance, origin=None, **kwargs):
+    if origin_model(origin) in (LGA, State):
+        return  # The LGA and its queue row are being deleted too
+    queue_lga_rechecks([instance.lga_id])
+
+# polling_results/live.py
+# Live result deltas over WebSockets (Django Channels). Every committed change
+# is published once per affected LGA / polling unit group and the channel
+# layer fans it out to the subscribers, so subscribers cost no queries.
+# Needs CHANNEL_LAYERS in settings; channels.layers.InMemoryChannelLayer works
+# in-process for a single server and for tests.
+from collections import defaultdict
+from asgiref.sync import async_to_sync
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from channels.layers import get_channel_layer
+from django.dispatch import receiver
+from django.urls import path
+from .rollups import results_changed
+
+LIVE_KINDS = ('lga', 'polling_unit')
+
+def live_group(kind, object_id):
+    return f'results.{kind}.{object_id}'
+
+class ResultsConsumer(AsyncJsonWebsocketConsumer):
+    """Pushes {kind, id, changes: [{party_id, delta}]} for one LGA or polling unit."""
+
+    async def connect(self):
+        route = self.scope['url_route']['kwargs']
+        if route['kind'] not in LIVE_KINDS:
+            await self.close()
+            return
+        self.group = live_group(route['kind'], route['object_id'])
+        await self.channel_layer.group_add(self.group, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, code):
+        if hasattr(self, 'group'):
+            await self.channel_layer.group_discard(self.group, self.channel_name)
+
+    async def results_delta(self, event):
+        await self.send_json(event['payload'])
+
+websocket_urlpatterns = [
+    path('ws/results/<str:kind>/<int:object_id>/', ResultsConsumer.as_asgi()),
+]
+
+def _group_changes(deltas):
+    grouped = defaultdict(list)
+    for (object_id, party_id), delta in sorted(deltas.items()):
+        grouped[object_id].append({'party_id': party_id, 'delta': delta})
+    return grouped
+
+@receiver(results_changed)
+def publish_result_deltas(sender, unit_deltas, lga_deltas, **kwargs):
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return  # CHANNEL_LAYERS is not configured
+    for kind, deltas in (('polling_unit', unit_deltas), ('lga', lga_deltas)):
+        for object_id, changes in _group_changes(deltas).items():
+            async_to_sync(channel_layer.group_send)(live_group(kind, object_id), {
+                'type': 'results.delta',
+                'payload': {'kind': kind, 'id': object_id, 'changes': changes},
+            })
+
+# polling_results/export.py
+import csv
+import json
+from asgiref.sync import sync_to_async
+from .models import AnnouncedPuResult, WardResultRollup, LgaResultRollup, StateResultRollup
+
+EXPORT_CHUNK_ROWS = 2000
+
+# level -> (model, id field, name field, score field)
+EXPORT_LEVELS = {
+    'polling_unit': (AnnouncedPuResult, 'polling_unit_id', 'polling_unit__polling_unit_name', 'party_score'),
+    'ward': (WardResultRollup, 'ward_id', 'ward__ward_name', 'total_score'),
+    'lga': (LgaResultRollup, 'lga_id', 'lga__lga_name', 'total_score'),
+    'state': (StateResultRollup, 'state_id', 'state__state_name', 'total_score'),
+}
+EXPORT_FORMATS = {'csv': 'text/csv', 'ndjson': 'application/x-ndjson'}
+
+class _Echo:
+    """File-like object whose write() hands back what csv.writer produced."""
+    def write(self, value):
+        return value
+
+def _csv_lines(level, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([f'{level}_id', f'{level}_name', 'party', 'score'])
+    for row in rows:
+        yield writer.writerow(row)
+
+def _ndjson_lines(level, rows):
+    for row_id, name, party, score in rows:
+        yield json.dumps({f'{level}_id': row_id, f'{level}_name': name, 'party': party, 'score': score}) + '\n'
+
+def _chunks(lines):
+    # The first line (the CSV header) goes out on its own so the first byte is
+    # not held back by the query; after that, lines are sent a chunk at a time
+    first = True
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if first or len(chunk) >= EXPORT_CHUNK_ROWS:
+            yield ''.join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield ''.join(chunk)
+
+def export_results(level, export_format):
+    """
+    Return a generator of CSV or NDJSON text chunks with the results at the
+    given aggregation level. Memory use does not depend on the number of rows.
+    """
+    if level not in EXPORT_LEVELS:
+        raise ValueError(f"Unknown export level {level}")
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {export_format}")
+
+    model, id_field, name_field, score_field = EXPORT_LEVELS[level]
+    # iterator() streams through a server-side cursor where the database has one
+    rows = model.objects.values_list(
+        id_field, name_field, 'party__party_name', score_field
+    ).order_by(id_field, 'party_id').iterator(chunk_size=EXPORT_CHUNK_ROWS)
+    lines = _csv_lines if export_format == 'csv' else _ndjson_lines
+    return _chunks(lines(level, rows))
+
+async def async_chunks(chunks):
+    """
+    Serve export_results() chunks to an ASGI server. Django would drain a
+    sync iterator into a list before sending the first byte; here each chunk
+    is pulled through sync_to_async on one thread, so the server-side cursor
+    stays on its connection and memory stays flat.
+    """
+    pull = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await pull(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Client went away mid-stream: release the cursor on its own thread
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+# polling_results/ingestion.py
+import csv
+import json
+from itertools import islice
+from django.db import transaction
+from django.db.models import Max
+from .models import PollingUnit, AnnouncedPuResult, IdSequence
+from .parties import get_party_ids, get_party_lookup
+from .rollups import apply_result_deltas
+
+DEFAULT_BATCH_SIZE = 1000
+
+def allocate_ids(model, count, past=None):
+    """
+    Reserve count consecutive primary keys for model and return the first one.
+    The block always starts above the highest existing id, so rows created
+    without the sequence (admin, seed_results, explicit ids) never collide,
+    and above past when given, so ids supplied explicitly are never handed out.
+    The sequence row is locked only for the duration of the reservation.
+    """
+    name = model._meta.label_lower
+    with transaction.atomic():
+        IdSequence.objects.get_or_create(name=name, defaults={'next_value': 1})
+        sequence = IdSequence.objects.select_for_update().get(name=name)
+        # Read on the primary key index, after the lock so concurrent reservations see each other
+        highest = model.objects.aggregate(last=Max('pk'))['last'] or 0
+        first = max(sequence.next_value, highest + 1, (past or 0) + 1)
+        IdSequence.objects.filter(name=name).update(next_value=first + count)
+    return first
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def _ingest_batch(batch, party_ids):
+    explicit_ids = [unit['polling_unit_id'] for unit in batch if unit.get('polling_unit_id')]
+    if len(set(explicit_ids)) != len(explicit_ids):
+        raise ValueError("Duplicate polling_unit_id in the same batch")
+    # One locked reservation covers both the new ids and the explicit ones
+    next_id = allocate_ids(PollingUnit, len(batch) - len(explicit_ids), max(explicit_ids, default=None))
+
+    units = []
+    results = []
+    deltas = {}
+    for unit in batch:
+        unit_id = unit.get('polling_unit_id')
+        if not unit_id:
+            unit_id = next_id
+            next_id += 1
+        units.append(PollingUnit(
+            polling_unit_id=unit_id,
+            polling_unit_name=unit['polling_unit_name'],
+            ward_id=unit['ward_id'],
+        ))
+        for party_id, score in unit['scores'].items():
+            if party_id not in party_ids:
+                raise ValueError(f"Unknown party {party_id} for polling unit {unit['polling_unit_name']}")
+            if score < 0:
+                raise ValueError(f"Negative score for party {party_id} in polling unit {unit['polling_unit_name']}")
+            if score > 0:  # Only create records for parties with scores
+                results.append(AnnouncedPuResult(
+                    polling_unit_id=unit_id, party_id=party_id, party_score=score
+                ))
+                deltas[(unit_id, party_id)] = score
+
+    with transaction.atomic():
+        taken = sorted(PollingUnit.objects.filter(pk__in=explicit_ids).values_list('pk', flat=True))
+        if taken:
+            raise ValueError(f"Polling units already exist with ids {taken}")
+        PollingUnit.objects.bulk_create(units)
+        AnnouncedPuResult.objects.bulk_create(results)
+        # bulk_create does not send post_save, so update the rollups here
+        apply_result_deltas(deltas)
+    return len(units)
+
+def ingest_polling_unit_results(units, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Store new polling units together with their party scores.
+    units is an iterable of dicts with polling_unit_name, ward_id, scores
+    (party_id -> score) and optionally polling_unit_id. Each batch is written
+    in its own transaction. Returns the number of polling units created.
+    """
+    party_ids = get_party_ids()
+    created = 0
+    for batch in _batched(units, batch_size):
+        created += _ingest_batch(batch, party_ids)
+    return created
+
+def _resolve_scores(scores, party_lookup):
+    resolved = {}
+    for party_name, score in scores.items():
+        if party_name not in party_lookup:
+            raise ValueError(f"Unknown party {party_name}")
+        resolved[party_lookup[party_name]] = int(score or 0)
+    return resolved
+
+def read_units_csv(fileobj):
+    """
+    Read polling units from CSV with polling_unit_name and ward_id columns,
+    an optional polling_unit_id column and one score column per party name.
+    """
+    party_lookup = get_party_lookup()
+    fixed_columns = {'polling_unit_id', 'polling_unit_name', 'ward_id'}
+    for row in csv.DictReader(fileobj):
+        yield {
+            'polling_unit_id': int(row['polling_unit_id']) if row.get('polling_unit_id') else None,
+            'polling_unit_name': row['polling_unit_name'],
+            'ward_id': int(row['ward_id']),
+            'scores': _resolve_scores(
+                {name: value for name, value in row.items() if name not in fixed_columns},
+                party_lookup,
+            ),
+        }
+
+def read_units_json(fileobj):
+    """
+    Read polling units from a JSON array of objects shaped like
+    {"polling_unit_name": ..., "ward_id": ..., "scores": {"PDP": 120, ...}}.
+    """
+    party_lookup = get_party_lookup()
+    for item in json.load(fileobj):
+        yield {
+            'polling_unit_id': int(item['polling_unit_id']) if item.get('polling_unit_id') else None,
+            'polling_unit_name': item['polling_unit_name'],
+            'ward_id': int(item['ward_id']),
+            'scores': _resolve_scores(item.get('scores', {}), party_lookup),
+        }
+
+# polling_results/instrumentation.py
+# Opt-in per-view instrumentation. Add
+# 'polling_results.instrumentation.QueryTimingMiddleware' to MIDDLEWARE and
+# the figures are served in Prometheus text format at metrics/.
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+from django.conf import settings
+from django.db import connection
+from django.template.backends.django import Template as DjangoTemplate
+
+logger = logging.getLogger('polling_results.instrumentation')
+
+QUERY_BUDGET = getattr(settings, 'POLLING_RESULTS_QUERY_BUDGET', 20)
+LATENCY_BUDGET_MS = getattr(settings, 'POLLING_RESULTS_LATENCY_BUDGET_MS', 500)
+LOGGED_STATEMENTS = 5
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+class _Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+class _ViewMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.queries = 0
+        self.sql_seconds = 0.0
+        self.template_seconds = 0.0
+        self.duration = _Histogram(DURATION_BUCKETS)
+        self.queries_per_request = _Histogram(QUERY_BUCKETS)
+        self.response_bytes = _Histogram(SIZE_BUCKETS)
+
+_metrics_lock = threading.Lock()
+_metrics = {}
+
+# Template time of the request being handled in this thread/task
+_template_seconds = contextvars.ContextVar('template_seconds', default=None)
+_original_template_render = DjangoTemplate.render
+
+def _timed_template_render(self, context=None, request=None):
+    timings = _template_seconds.get()
+    if timings is None:
+        return _original_template_render(self, context, request)
+    started = time.perf_counter()
+    try:
+        return _original_template_render(self, context, request)
+    finally:
+        timings.append(time.perf_counter() - started)
+
+class QueryTimingMiddleware:
+    """Records queries, SQL time, template time, duration and size per view."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        DjangoTemplate.render = _timed_template_render
+
+    def __call__(self, request):
+        statements = []
+
+        def record_query(execute, sql, params, many, context):
+            started = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                statements.append((time.perf_counter() - started, sql))
+
+        template_timings = []
+        token = _template_seconds.set(template_timings)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(record_query):
+                response = self.get_response(request)
+        finally:
+            _template_seconds.reset(token)
+
+        match = getattr(request, 'resolver_match', None)
+        view = match.view_name if match else 'unresolved'
+
+        def finish(size):
+            duration = time.perf_counter() - started
+            self.record(view, duration, statements, sum(template_timings), size)
+            self.check_budget(request, view, duration, statements)
+
+        if not response.streaming:
+            finish(len(response.content))
+        elif getattr(response, 'is_async', False):
+            # An async stream is consumed on the event loop after this returns,
+            # so only the queries made before the first chunk are counted
+            finish(None)
+        else:
+            # Querysets in a streamed body run while the server iterates it, so
+            # the figures are recorded once the last chunk has gone out
+            response.streaming_content = self.timed_stream(response.streaming_content, record_query, finish)
+        return response
+
+    @staticmethod
+    def timed_stream(chunks, record_query, finish):
+        size = 0
+        try:
+            with connection.execute_wrapper(record_query):
+                for chunk in chunks:
+                    size += len(chunk)
+                    yield chunk
+        finally:
+            finish(size)
+
+    def record(self, view, duration, statements, template_seconds, size):
+        with _metrics_lock:
+            metrics = _metrics.setdefault(view, _ViewMetrics())
+            metrics.requests += 1
+            metrics.queries += len(statements)
+            metrics.sql_seconds += sum(seconds for seconds, _ in statements)
+            metrics.template_seconds += template_seconds
+            metrics.duration.observe(duration)
+            metrics.queries_per_request.observe(len(statements))
+            if size is not None:
+                metrics.response_bytes.observe(size)
+
+    def check_budget(self, request, view, duration, statements):
+        if len(statements) <= QUERY_BUDGET and duration * 1000 <= LATENCY_BUDGET_MS:
+            return
+        slowest = sorted(statements, key=lambda statement: statement[0], reverse=True)[:LOGGED_STATEMENTS]
+        logger.warning(
+            "%s %s (%s) over budget: %d queries, %.1f ms. Slowest SQL:\n%s",
+            request.method, request.path, view, len(statements), duration * 1000,
+            "\n".join(f"{seconds * 1000:.1f} ms  {sql}" for seconds, sql in slowest),
+        )
+
+def _histogram_lines(name, view, histogram):
+    lines = []
+    cumulative = 0
+    for bound, count in zip(list(histogram.buckets) + ['+Inf'], histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{view="{view}",le="{bound}"}} {cumulative}')
+    lines.append(f'{name}_sum{{view="{view}"}} {histogram.total}')
+    lines.append(f'{name}_count{{view="{view}"}} {cumulative}')
+    return lines
+
+def render_metrics():
+    """All recorded figures in the Prometheus text exposition format."""
+    counters = (
+        ('polling_results_requests_total', 'requests'),
+        ('polling_results_queries_total', 'queries'),
+        ('polling_results_sql_seconds_total', 'sql_seconds'),
+        ('polling_results_template_seconds_total', 'template_seconds'),
+    )
+    histograms = (
+        ('polling_results_request_duration_seconds', 'duration'),
+        ('polling_results_queries_per_request', 'queries_per_request'),
+        ('polling_results_response_bytes', 'response_bytes'),
+    )
+    with _metrics_lock:
+        lines = []
+        for name, attribute in counters:
+            lines.append(f'# TYPE {name} counter')
+            for view, metrics in sorted(_metrics.items()):
+                lines.append(f'{name}{{view="{view}"}} {getattr(metrics, attribute)}')
+        for name, attribute in histograms:
+            lines.append(f'# TYPE {name} histogram')
+            for view, metrics in sorted(_metrics.items()):
+                lines.extend(_histogram_lines(name, view, getattr(metrics, attribute)))
+    return "\n".join(lines) + "\n"
+
 # Now let's create the views for each of the required tasks
 
 # polling_results/views.py
+import copy
+from django.conf import settings
+from django.core.exceptions import BadRequest
+from django.core.handlers.asgi import ASGIRequest
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect
-from django.db.models import Sum
-from .models import PollingUnit, LGA, Party, AnnouncedPuResult, AnnouncedLgaResult
+from django.db.models import Max
+from django.utils.cache import get_conditional_response
+from django.utils.crypto import constant_time_compare
+from django.utils.http import http_date, quote_etag
+from .models import (
+    State, PollingUnit, LGA, Ward, AnnouncedPuResult, AnnouncedLgaResult,
+    LgaResultRollup, StateResultRollup, LgaDiscrepancy, LgaRecheck,
+)
+from .ingestion import ingest_polling_unit_results
+from .cache import cache_stats, get_or_compute
+from .export import EXPORT_FORMATS, async_chunks, export_results
+from .instrumentation import render_metrics
+from .parties import get_parties, party_score_fields
 from django import forms
 
+def _int_param(request, name):
+    """
+    Integer value of a query parameter, None when it is empty. Cache keys and
+    invalidation both use the int, so '7' and '07' share one cache entry.
+    """
+    value = request.GET.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer")
+
 # Question 1: Display result for any individual polling unit
 def polling_unit_result(request):
-    polling_units = PollingUnit.objects.all()
+    # The dropdown is filled page by page from polling_unit_api
+    selected_unit = None
     results = None
     
     if request.method == 'GET' and 'polling_unit' in request.GET:
-        polling_unit_id = request.GET.get('polling_unit')
-        if polling_unit_id:
-            results = AnnouncedPuResult.objects.filter(polling_unit_id=polling_unit_id)
+        polling_unit_id = _int_param(request, 'polling_unit')
+        if polling_unit_id is not None:
+            selected_unit, results = get_or_compute('polling_unit', polling_unit_id, lambda: (
+                PollingUnit.objects.filter(pk=polling_unit_id).values(
+                    'polling_unit_id', 'polling_unit_name'
+                ).first(),
+                list(AnnouncedPuResult.objects.filter(
+                    polling_unit_id=polling_unit_id
+                ).select_related('party')),
+            ))
     
     return render(request, 'polling_results/polling_unit_result.html', {
-        'polling_units': polling_units,
+        'selected_unit': selected_unit,
         'results': results
     })
 
 # Question 2: Display summed total result for all polling units under a particular LGA
 def lga_result(request):
-    lgas = LGA.objects.all()
+    # The dropdown is filled page by page from lga_api
     summed_results = None
     selected_lga = None
     
     if request.method == 'GET' and 'lga' in request.GET:
-        lga_id = request.GET.get('lga')
-        if lga_id:
-            selected_lga = LGA.objects.get(pk=lga_id)
-            # Get all polling units in this LGA
-            polling_units_in_lga = PollingUnit.objects.filter(ward__lga_id=lga_id)
-            
-            # Get summed results for each party across these polling units
-            summed_results = AnnouncedPuResult.objects.filter(
-                polling_unit__in=polling_units_in_lga
-            ).values('party__party_name').annotate(
-                total_score=Sum('party_score')
-            ).order_by('-total_score')
+        lga_id = _int_param(request, 'lga')
+        if lga_id is not None:
+            # Read the per-party totals from the LGA rollup
+            selected_lga, summed_results = get_or_compute('lga', lga_id, lambda: (
+                LGA.objects.get(pk=lga_id),
+                list(LgaResultRollup.objects.filter(
+                    lga_id=lga_id
+                ).values('party__party_name', 'total_score').order_by('-total_score')),
+            ))
     
     return render(request, 'polling_results/lga_result.html', {
-        'lgas': lgas,
         'summed_results': summed_results,
         'selected_lga': selected_lga
     })
 
+# Announced LGA totals that do not match the sum of their polling units
+def lga_reconciliation(request):
+    discrepancies = LgaDiscrepancy.objects.select_related('lga', 'party').order_by('lga__lga_name', 'party__party_name')
+    return render(request, 'polling_results/lga_reconciliation.html', {
+        'discrepancies': discrepancies,
+        'pending_count': LgaRecheck.objects.count(),
+    })
+
+# JSON pages of polling units and LGAs for the dropdowns
+API_PAGE_SIZE = 50
+API_MAX_PAGE_SIZE = 500
+
+def _keyset_page(request, queryset, id_field, name_field, filters, search_field=None):
+    """
+    One page of {id, name} rows ordered by id, starting after the ?after= cursor.
+    filters maps query parameters to lookups; ?q= is a case-insensitive name prefix,
+    matched against search_field (an upper-cased copy of the name) when given.
+    """
+    try:
+        after = int(request.GET['after']) if request.GET.get('after') else None
+        limit = int(request.GET.get('limit') or API_PAGE_SIZE)
+        lookups = {
+            lookup: int(request.GET[param])
+            for param, lookup in filters.items() if request.GET.get(param)
+        }
+    except ValueError:
+        return JsonResponse({'error': "after, limit and filters must be integers"}, status=400)
+    if not 0 < limit <= API_MAX_PAGE_SIZE:
+        return JsonResponse({'error': f"limit must be between 1 and {API_MAX_PAGE_SIZE}"}, status=400)
+
+    if after is not None:
+        lookups[f'{id_field}__gt'] = after
+    if request.GET.get('q') and search_field:
+        lookups[f'{search_field}__startswith'] = request.GET['q'].upper()
+    elif request.GET.get('q'):
+        lookups[f'{name_field}__istartswith'] = request.GET['q']
+
+    # Fetch one extra row to know whether there is another page
+    rows = list(queryset.filter(**lookups).order_by(id_field).values_list(id_field, name_field)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    return JsonResponse({
+        'results': [{'id': row_id, 'name': name} for row_id, name in rows],
+        'next': rows[-1][0] if has_more else None,
+    })
+
+def polling_unit_api(request):
+    return _keyset_page(request, PollingUnit.objects.all(), 'polling_unit_id', 'polling_unit_name', {
+        'ward': 'ward_id',
+        'lga': 'ward__lga_id',
+        'state': 'ward__lga__state_id',
+    }, search_field='search_name')
+
+def lga_api(request):
+    return _keyset_page(request, LGA.objects.all(), 'lga_id', 'lga_name', {
+        'state': 'state_id',
+    })
+
+# Streaming CSV/NDJSON export at polling unit, ward, LGA or state level
+def export_results_view(request, level):
+    export_format = request.GET.get('format', 'csv')
+    try:
+        chunks = export_results(level, export_format)
+    except ValueError as exc:
+        raise Http404(str(exc))
+    if isinstance(request, ASGIRequest):
+        chunks = async_chunks(chunks)
+    response = StreamingHttpResponse(chunks, content_type=EXPORT_FORMATS[export_format])
+    response['Content-Disposition'] = f'attachment; filename="{level}_results.{export_format}"'
+    return response
+
+# Statewide dashboard: every LGA's party totals read from the rollups.
+# Unchanged dashboards are answered with 304 after one indexed query for the
+# newest updated_at of the state's rollup rows, which every worker sees alike.
+DASHBOARD_PAGE_SIZE = 50
+
+async def _conditional_dashboard(request, state_id, respond):
+    """
+    Answer with 304 when the client's ETag or Last-Modified is still current,
+    otherwise await respond() and stamp the validators on its response.
+    The condition decorator calls its validators synchronously, so it cannot
+    query the database from an async view.
+    """
+    modified = (await StateResultRollup.objects.filter(state_id=state_id).aaggregate(
+        modified=Max('updated_at')
+    ))['modified']
+    if modified is None:
+        return await respond()  # No results yet; nothing to validate against
+    etag = quote_etag(f'state-{state_id}-{modified.timestamp()}')
+    response = get_conditional_response(request, etag=etag, last_modified=int(modified.timestamp()))
+    if response is None:
+        response = await respond()
+        if response.status_code == 200:
+            response.headers['ETag'] = etag
+            response.headers['Last-Modified'] = http_date(modified.timestamp())
+    return response
+
+async def _state_dashboard_data(request, state_id):
+    """State totals plus one keyset page (?after=, ?limit=) of LGA totals."""
+    try:
+        after = int(request.GET['after']) if request.GET.get('after') else None
+        limit = int(request.GET.get('limit') or DASHBOARD_PAGE_SIZE)
+    except ValueError:
+        raise ValueError("after and limit must be integers") from None
+    if not 0 < limit <= API_MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {API_MAX_PAGE_SIZE}")
+
+    state = await State.objects.filter(pk=state_id).values('state_id', 'state_name').afirst()
+    if state is None:
+        raise Http404("No such state")
+    state['totals'] = [
+        {'party': party, 'total_score': score}
+        async for party, score in StateResultRollup.objects.filter(
+            state_id=state_id
+        ).values_list('party__party_name', 'total_score').order_by('-total_score')
+    ]
+
+    lgas = LGA.objects.filter(state_id=state_id)
+    if after is not None:
+        lgas = lgas.filter(lga_id__gt=after)
+    page = [row async for row in lgas.order_by('lga_id').values_list('lga_id', 'lga_name')[:limit + 1]]
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    # One query for the party totals of every LGA on the page
+    totals = {lga_id: [] for lga_id, _ in page}
+    async for lga_id, party, score in LgaResultRollup.objects.filter(
+        lga_id__in=list(totals)
+    ).values_list('lga_id', 'party__party_name', 'total_score').order_by('lga_id', '-total_score'):
+        totals[lga_id].append({'party': party, 'total_score': score})
+
+    return {
+        'state': state,
+        'lgas': [
+            {'lga_id': lga_id, 'lga_name': lga_name, 'totals': totals[lga_id]}
+            for lga_id, lga_name in page
+        ],
+        'next': page[-1][0] if has_more else None,
+    }
+
+async def state_dashboard(request, state_id):
+    async def respond():
+        try:
+            dashboard = await _state_dashboard_data(request, state_id)
+        except ValueError as exc:
+            return HttpResponse(str(exc), status=400)
+        return render(request, 'polling_results/state_dashboard.html', {'dashboard': dashboard})
+    return await _conditional_dashboard(request, state_id, respond)
+
+async def state_dashboard_api(request, state_id):
+    async def respond():
+        try:
+            dashboard = await _state_dashboard_data(request, state_id)
+        except ValueError as exc:
+            return JsonResponse({'error': str(exc)}, status=400)
+        return JsonResponse(dashboard)
+    return await _conditional_dashboard(request, state_id, respond)
+
+# Cache hit/miss counters for this process, to check the hit rate under load
+def results_cache_stats(request):
+    return JsonResponse(cache_stats())
+
+# Prometheus scrape endpoint for the instrumentation middleware. With
+# POLLING_RESULTS_METRICS_TOKEN set the scraper must send it as a bearer token;
+# without it only local clients are served, which is every client once a
+# reverse proxy sits in front, so set the token (or keep metrics/ off the
+# proxy) in any proxied deployment.
+LOCAL_ADDRESSES = ('127.0.0.1', '::1')
+
+def metrics(request):
+    token = getattr(settings, 'POLLING_RESULTS_METRICS_TOKEN', None)
+    if token:
+        if not constant_time_compare(request.META.get('HTTP_AUTHORIZATION', ''), f'Bearer {token}'):
+            raise Http404("metrics need the scrape token")
+    elif request.META.get('REMOTE_ADDR') not in LOCAL_ADDRESSES:
+        raise Http404("metrics are only served locally")
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4')
+
 # Question 3: Store results for ALL parties for a new polling unit
 class NewResultForm(forms.Form):
     polling_unit_name = forms.CharField(max_length=100)
@@ -119,37 +1351,24 @@ class NewResultForm(forms.Form):
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Dynamically add fields for each party
-        parties = Party.objects.all()
-        for party in parties:
-            self.fields[f'party_{party.party_id}'] = forms.IntegerField(
-                label=f'{party.party_name} Score',
-                min_value=0,
-                initial=0
-            )
+        # Dynamically add fields for each party, copied from the cached definitions
+        for name, field in party_score_fields().items():
+            self.fields[name] = copy.deepcopy(field)
 
 def new_polling_unit_result(request):
     if request.method == 'POST':
         form = NewResultForm(request.POST)
         if form.is_valid():
-            # Create new polling unit
-            new_unit = PollingUnit.objects.create(
-                polling_unit_name=form.cleaned_data['polling_unit_name'],
-                ward=form.cleaned_data['ward'],
-                # Generate a new unique ID
-                polling_unit_id=PollingUnit.objects.order_by('-polling_unit_id').first().polling_unit_id + 1
-            )
-            
-            # Save results for each party
-            parties = Party.objects.all()
-            for party in parties:
-                party_score = form.cleaned_data[f'party_{party.party_id}']
-                if party_score > 0:  # Only create records for parties with scores
-                    AnnouncedPuResult.objects.create(
-                        polling_unit=new_unit,
-                        party=party,
-                        party_score=party_score
-                    )
+            # Create the polling unit and its results in one batch
+            parties = get_parties()
+            ingest_polling_unit_results([{
+                'polling_unit_name': form.cleaned_data['polling_unit_name'],
+                'ward_id': form.cleaned_data['ward'].ward_id,
+                'scores': {
+                    party.party_id: form.cleaned_data[f'party_{party.party_id}']
+                    for party in parties
+                },
+            }])
             
             return redirect('polling_unit_result')
     else:
@@ -157,7 +1376,7 @@ def new_polling_unit_result(request):
     
     return render(request, 'polling_results/new_polling_unit.html', {
         'form': form,
-        'parties': Party.objects.all()
+        'parties': get_parties()
     })
 
 # polling_results/urls.py
@@ -168,8 +1387,1163 @@ urlpatterns = [
     path('polling-unit/', views.polling_unit_result, name='polling_unit_result'),
     path('lga-result/', views.lga_result, name='lga_result'),
     path('new-result/', views.new_polling_unit_result, name='new_polling_unit_result'),
+    path('lga-reconciliation/', views.lga_reconciliation, name='lga_reconciliation'),
+    path('api/polling-units/', views.polling_unit_api, name='polling_unit_api'),
+    path('api/lgas/', views.lga_api, name='lga_api'),
+    path('export/<str:level>/', views.export_results_view, name='export_results'),
+    path('dashboard/<int:state_id>/', views.state_dashboard, name='state_dashboard'),
+    path('api/dashboard/<int:state_id>/', views.state_dashboard_api, name='state_dashboard_api'),
+    path('cache-stats/', views.results_cache_stats, name='results_cache_stats'),
+    path('metrics/', views.metrics, name='metrics'),
 ]
 
+# polling_results/migrations/0001_initial.py
+import django.db.models.deletion
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Party',
+            fields=[
+                ('party_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('party_name', models.CharField(max_length=100)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='State',
+            fields=[
+                ('state_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('state_name', models.CharField(max_length=100)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LGA',
+            fields=[
+                ('lga_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('lga_name', models.CharField(max_length=100)),
+                ('state', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.state')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Ward',
+            fields=[
+                ('ward_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('ward_name', models.CharField(max_length=100)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.lga')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='PollingUnit',
+            fields=[
+                ('polling_unit_id', models.IntegerField(primary_key=True, serialize=False)),
+                ('polling_unit_name', models.CharField(max_length=100)),
+                ('ward', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.ward')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='AnnouncedLgaResult',
+            fields=[
+                ('result_id', models.AutoField(primary_key=True, serialize=False)),
+                ('party_score', models.IntegerField()),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.lga')),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.party')),
+            ],
+            options={
+                'unique_together': {('lga', 'party')},
+            },
+        ),
+        migrations.CreateModel(
+            name='AnnouncedPuResult',
+            fields=[
+                ('result_id', models.AutoField(primary_key=True, serialize=False)),
+                ('party_score', models.IntegerField()),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.party')),
+                ('polling_unit', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.pollingunit')),
+            ],
+            options={
+                'unique_together': {('polling_unit', 'party')},
+            },
+        ),
+    ]
+
+# polling_results/migrations/0002_result_rollups.py
+import django.db.models.deletion
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polling_results', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WardResultRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_score', models.BigIntegerField(default=0)),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.party')),
+                ('ward', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.ward')),
+            ],
+            options={
+                'unique_together': {('ward', 'party')},
+            },
+        ),
+        migrations.CreateModel(
+            name='LgaResultRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_score', models.BigIntegerField(default=0)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.lga')),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.party')),
+            ],
+            options={
+                'unique_together': {('lga', 'party')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StateResultRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_score', models.BigIntegerField(default=0)),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.party')),
+                ('state', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.state')),
+            ],
+            options={
+                'unique_together': {('state', 'party')},
+            },
+        ),
+    ]
+
+# polling_results/migrations/0003_idsequence.py
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polling_results', '0002_result_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdSequence',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False)),
+                ('next_value', models.BigIntegerField()),
+            ],
+        ),
+    ]
+
+# polling_results/migrations/0004_pollingunit_search_name.py
+from django.db import migrations, models
+from django.db.models.functions import Upper
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polling_results', '0003_idsequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pollingunit',
+            name='search_name',
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=Upper('polling_unit_name'),
+                output_field=models.CharField(max_length=100),
+            ),
+        ),
+    ]
+
+# polling_results/migrations/0005_result_query_indexes.py
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polling_results', '0004_pollingunit_search_name'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lga',
+            index=models.Index(fields=['state', 'lga_id'], name='lga_state_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ward',
+            index=models.Index(fields=['lga', 'ward_id'], name='ward_lga_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pollingunit',
+            index=models.Index(fields=['ward', 'polling_unit_id'], name='pu_ward_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='announcedpuresult',
+            index=models.Index(fields=['polling_unit', 'party', 'party_score'], name='pu_result_covering_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='announcedlgaresult',
+            index=models.Index(fields=['lga', 'party', 'party_score'], name='lga_result_covering_idx'),
+        ),
+    ]
+
+# polling_results/migrations/0006_lga_reconciliation.py
+import django.db.models.deletion
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polling_results', '0005_result_query_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LgaRecheck',
+            fields=[
+                ('lga', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='polling_results.lga')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LgaDiscrepancy',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('announced_score', models.BigIntegerField(null=True)),
+                ('computed_score', models.BigIntegerField(null=True)),
+                ('checked_at', models.DateTimeField(auto_now=True)),
+                ('lga', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.lga')),
+                ('party', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='polling_results.party')),
+            ],
+            options={
+                'unique_together': {('lga', 'party')},
+            },
+        ),
+    ]
+
+# polling_results/migrations/0007_rollup_updated_at.py
+import django.utils.timezone
+from django.db import migrations, models
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polling_results', '0006_lga_reconciliation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='wardresultrollup',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='lgaresultrollup',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='stateresultrollup',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
+
+# polling_results/seed.py
+import random
+from django.db import transaction
+from .models import State, LGA, Ward, PollingUnit, Party, AnnouncedPuResult, AnnouncedLgaResult
+from .rollups import rebuild_rollups
+
+# Roughly the national shape: 37 states, 774 LGAs, 8,809 wards, 176,846 polling units
+NATIONAL_SCALE = {
+    'states': 37,
+    'lgas_per_state': 21,
+    'wards_per_lga': 11,
+    'units_per_ward': 20,
+    'parties': 18,
+}
+
+def seed_results(states, lgas_per_state, wards_per_lga, units_per_ward, parties,
+                 seed=0, batch_size=5000):
+    """
+    Fill empty tables with a deterministic states -> LGAs -> wards -> polling
+    units -> party results hierarchy, plus announced LGA totals and rollups.
+    Returns the number of AnnouncedPuResult rows created.
+    """
+    if PollingUnit.objects.exists():
+        raise ValueError("Refusing to seed: polling units already exist")
+    rng = random.Random(seed)
+
+    with transaction.atomic():
+        Party.objects.bulk_create(
+            [Party(party_id=i, party_name=f'PARTY{i}') for i in range(1, parties + 1)]
+        )
+        State.objects.bulk_create(
+            [State(state_id=i, state_name=f'State {i}') for i in range(1, states + 1)]
+        )
+        lgas = [
+            LGA(lga_id=(state_id - 1) * lgas_per_state + i, lga_name=f'LGA {state_id}-{i}', state_id=state_id)
+            for state_id in range(1, states + 1) for i in range(1, lgas_per_state + 1)
+        ]
+        LGA.objects.bulk_create(lgas, batch_size=batch_size)
+        wards = [
+            Ward(ward_id=(lga.lga_id - 1) * wards_per_lga + i, ward_name=f'Ward {lga.lga_id}-{i}', lga_id=lga.lga_id)
+            for lga in lgas for i in range(1, wards_per_lga + 1)
+        ]
+        Ward.objects.bulk_create(wards, batch_size=batch_size)
+
+        lga_totals = {}
+        created = 0
+        units = []
+        results = []
+        for ward in wards:
+            for i in range(1, units_per_ward + 1):
+                unit_id = (ward.ward_id - 1) * units_per_ward + i
+                units.append(PollingUnit(
+                    polling_unit_id=unit_id, polling_unit_name=f'PU {ward.ward_id}-{i}', ward_id=ward.ward_id
+                ))
+                for party_id in range(1, parties + 1):
+                    score = rng.randint(0, 300)
+                    results.append(AnnouncedPuResult(polling_unit_id=unit_id, party_id=party_id, party_score=score))
+                    key = (ward.lga_id, party_id)
+                    lga_totals[key] = lga_totals.get(key, 0) + score
+            if len(results) >= batch_size:
+                PollingUnit.objects.bulk_create(units)
+                AnnouncedPuResult.objects.bulk_create(results)
+                created += len(results)
+                units, results = [], []
+        PollingUnit.objects.bulk_create(units)
+        AnnouncedPuResult.objects.bulk_create(results)
+        created += len(results)
+
+        AnnouncedLgaResult.objects.bulk_create([
+            AnnouncedLgaResult(lga_id=lga_id, party_id=party_id, party_score=total)
+            for (lga_id, party_id), total in lga_totals.items()
+        ], batch_size=batch_size)
+    rebuild_rollups()
+    return created
+
+# polling_results/management/commands/benchmark_queries.py
+import contextlib
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.models import Sum
+from polling_results.models import (
+    LGA, Ward, PollingUnit, AnnouncedPuResult, AnnouncedLgaResult, LgaResultRollup,
+)
+from polling_results.seed import NATIONAL_SCALE, seed_results
+
+# The indexes added by 0005_result_query_indexes
+QUERY_INDEXES = (
+    (LGA, 'lga_state_idx'),
+    (Ward, 'ward_lga_idx'),
+    (PollingUnit, 'pu_ward_keyset_idx'),
+    (AnnouncedPuResult, 'pu_result_covering_idx'),
+    (AnnouncedLgaResult, 'lga_result_covering_idx'),
+)
+
+@contextlib.contextmanager
+def _without_query_indexes():
+    """Drop only the query indexes for the duration, touching no table or data."""
+    indexes = [
+        (model, next(index for index in model._meta.indexes if index.name == name))
+        for model, name in QUERY_INDEXES
+    ]
+    with connection.schema_editor() as editor:
+        for model, index in indexes:
+            editor.remove_index(model, index)
+    try:
+        yield
+    finally:
+        with connection.schema_editor() as editor:
+            for model, index in indexes:
+                editor.add_index(model, index)
+
+def _hot_queries(lga_id, ward_id, polling_unit_id):
+    return {
+        'lga_aggregate': AnnouncedPuResult.objects.filter(
+            polling_unit__ward__lga_id=lga_id
+        ).values('party_id').annotate(total=Sum('party_score')),
+        'lga_rollup': LgaResultRollup.objects.filter(lga_id=lga_id).values('party_id', 'total_score'),
+        'polling_unit_results': AnnouncedPuResult.objects.filter(
+            polling_unit_id=polling_unit_id
+        ).select_related('party'),
+        'ward_units_page': PollingUnit.objects.filter(
+            ward_id=ward_id, polling_unit_id__gt=0
+        ).order_by('polling_unit_id').values_list('polling_unit_id', 'polling_unit_name')[:50],
+        'announced_lga': AnnouncedLgaResult.objects.filter(lga_id=lga_id).values('party_id', 'party_score'),
+    }
+
+def _full_scan(plan):
+    # PostgreSQL reports "Seq Scan"; SQLite reports "SCAN <table>" without an index
+    return any(
+        'Seq Scan' in line or (line.strip().startswith(('SCAN', '--SCAN')) and 'INDEX' not in line)
+        for line in plan.splitlines()
+    )
+
+class Command(BaseCommand):
+    help = "Seed a national-scale dataset and report EXPLAIN plans and latencies of the hot result queries"
+
+    def add_arguments(self, parser):
+        for name, default in NATIONAL_SCALE.items():
+            parser.add_argument(f'--{name.replace("_", "-")}', type=int, default=default)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--compare-indexes', action='store_true',
+                            help="Also measure with the 0005_result_query_indexes indexes dropped, "
+                                 "then re-create them")
+
+    def measure(self, label):
+        unit = PollingUnit.objects.select_related('ward').order_by('polling_unit_id').last()
+        queries = _hot_queries(unit.ward.lga_id, unit.ward_id, unit.polling_unit_id)
+        self.stdout.write(f"== {label} ({connection.vendor})")
+        for name, queryset in queries.items():
+            plan = queryset.explain()
+            timings = []
+            for _ in range(self.repeat):
+                started = time.perf_counter()
+                list(queryset.all())
+                timings.append((time.perf_counter() - started) * 1000)
+            flag = "  FULL SCAN" if _full_scan(plan) else ""
+            self.stdout.write(
+                f"{name}: median {statistics.median(timings):.2f} ms, max {max(timings):.2f} ms{flag}"
+            )
+            for line in plan.splitlines():
+                self.stdout.write(f"    {line}")
+
+    def handle(self, *args, **options):
+        self.repeat = options['repeat']
+        if not PollingUnit.objects.exists():
+            self.stdout.write("Seeding dataset...")
+            started = time.perf_counter()
+            created = seed_results(**{name: options[name] for name in NATIONAL_SCALE})
+            self.stdout.write(f"Seeded {created} results in {time.perf_counter() - started:.1f} s")
+
+        if options['compare_indexes']:
+            with _without_query_indexes():
+                self.measure("before (without the query indexes)")
+        self.measure("after")
+
+# polling_results/management/commands/benchmark_views.py
+import json
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from django.core.management.base import BaseCommand
+from django.db import connection, connections
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment
+from django.urls import reverse
+from polling_results.ingestion import ingest_polling_unit_results
+from polling_results.models import LGA, Ward, Party, PollingUnit
+from polling_results.seed import NATIONAL_SCALE, seed_results
+
+def _percentile(values, fraction):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+class Command(BaseCommand):
+    help = ("Load-test polling_unit_result, lga_result and new_polling_unit_result with concurrent "
+            "in-process requests and write latency/query/ingestion figures as JSON. "
+            "Run it against a scratch database: it seeds data and adds polling units.")
+
+    def add_arguments(self, parser):
+        for name, default in NATIONAL_SCALE.items():
+            parser.add_argument(f'--{name.replace("_", "-")}', type=int, default=default)
+        parser.add_argument('--requests', type=int, default=2000, help="Requests per view")
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--ingest-units', type=int, default=10000,
+                            help="Polling units to load through the bulk ingestion path")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', default='benchmark_views.json')
+
+    def handle(self, *args, **options):
+        # Lets the test client through ALLOWED_HOSTS and records rendered templates
+        setup_test_environment()
+        rng = random.Random(options['seed'])
+        report = {
+            'commit': _git_commit(),
+            'started_at': datetime.now(timezone.utc).isoformat(),
+            'database': connection.vendor,
+            'scale': {name: options[name] for name in NATIONAL_SCALE},
+            'threads': options['threads'],
+        }
+
+        if not PollingUnit.objects.exists():
+            started = time.perf_counter()
+            created = seed_results(seed=options['seed'], **report['scale'])
+            report['seed'] = {'results': created, 'seconds': time.perf_counter() - started}
+
+        report['ingestion'] = self.measure_ingestion(rng, options['ingest_units'])
+
+        unit_ids = list(PollingUnit.objects.values_list('polling_unit_id', flat=True))
+        lga_ids = list(LGA.objects.values_list('lga_id', flat=True))
+        ward_ids = list(Ward.objects.values_list('ward_id', flat=True))
+        party_ids = list(Party.objects.values_list('party_id', flat=True))
+        count = options['requests']
+        plans = {
+            'polling_unit_result': [
+                ('get', reverse('polling_unit_result'), {'polling_unit': rng.choice(unit_ids)})
+                for _ in range(count)
+            ],
+            'lga_result': [
+                ('get', reverse('lga_result'), {'lga': rng.choice(lga_ids)})
+                for _ in range(count)
+            ],
+            'new_polling_unit_result': [
+                ('post', reverse('new_polling_unit_result'), {
+                    'polling_unit_name': f'Load test {i}',
+                    'ward': rng.choice(ward_ids),
+                    **{f'party_{party_id}': rng.randint(0, 300) for party_id in party_ids},
+                })
+                for i in range(count)
+            ],
+        }
+        report['views'] = {
+            name: self.run_requests(plan, options['threads']) for name, plan in plans.items()
+        }
+
+        with open(options['output'], 'w', encoding='utf-8') as output:
+            json.dump(report, output, indent=2)
+        for name, figures in report['views'].items():
+            if not figures['requests']:
+                self.stdout.write(f"{name}: no requests")
+                continue
+            self.stdout.write(
+                f"{name}: p50 {figures['p50_ms']:.1f} ms, p99 {figures['p99_ms']:.1f} ms, "
+                f"{figures['queries_per_request']:.1f} queries/request, {figures['requests_per_second']:.0f} req/s"
+            )
+        self.stdout.write(f"ingestion: {report['ingestion']['rows_per_second']:.0f} rows/s")
+        self.stdout.write(self.style.SUCCESS(f"Wrote {options['output']}"))
+
+    def measure_ingestion(self, rng, unit_count):
+        ward_ids = list(Ward.objects.values_list('ward_id', flat=True))
+        party_ids = list(Party.objects.values_list('party_id', flat=True))
+        units = [{
+            'polling_unit_name': f'Ingested {i}',
+            'ward_id': rng.choice(ward_ids),
+            'scores': {party_id: rng.randint(1, 300) for party_id in party_ids},
+        } for i in range(unit_count)]
+        rows = sum(1 + len(unit['scores']) for unit in units)
+        started = time.perf_counter()
+        ingest_polling_unit_results(units)
+        seconds = time.perf_counter() - started
+        return {'units': unit_count, 'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds else None}
+
+    def run_requests(self, plan, threads):
+        local = threading.local()
+
+        def run(request):
+            # One test client (and database connection) per worker thread; a view
+            # that raises counts as a 500 instead of aborting the whole run
+            if not hasattr(local, 'client'):
+                local.client = Client(raise_request_exception=False)
+            method, url, data = request
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = getattr(local.client, method)(url, data)
+                elapsed = time.perf_counter() - started
+            return elapsed * 1000, len(queries), response.status_code
+
+        def run_and_close(requests):
+            try:
+                return [run(request) for request in requests]
+            finally:
+                connections.close_all()
+
+        # Deal the requests out so every thread keeps its own client and connection
+        shards = [plan[i::threads] for i in range(threads)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            samples = [sample for shard in executor.map(run_and_close, shards) for sample in shard]
+        wall = time.perf_counter() - started
+
+        latencies = [latency for latency, _, _ in samples]
+        return {
+            'requests': len(samples),
+            'errors': sum(1 for _, _, status in samples if status >= 400),
+            'p50_ms': _percentile(latencies, 0.50),
+            'p99_ms': _percentile(latencies, 0.99),
+            'queries_per_request': sum(queries for _, queries, _ in samples) / len(samples) if samples else None,
+            'requests_per_second': len(samples) / wall if samples else None,
+        }
+
+# polling_results/management/commands/rebuild_rollups.py
+from django.core.management.base import BaseCommand, CommandError
+from polling_results.rollups import rebuild_rollups, verify_rollups
+
+class Command(BaseCommand):
+    help = "Rebuild the ward/LGA/state result rollups and verify them against a full recomputation"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verify-only', action='store_true',
+                            help="Only compare the stored rollups, do not rebuild them")
+
+    def handle(self, *args, **options):
+        if not options['verify_only']:
+            rebuild_rollups()
+            self.stdout.write("Rollups rebuilt.")
+
+        mismatches = verify_rollups()
+        for level, key, party_id, stored, expected in mismatches:
+            self.stderr.write(f"{level} {key} party {party_id}: stored {stored}, expected {expected}")
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} rollup rows do not match the polling unit results")
+        self.stdout.write(self.style.SUCCESS("Rollups match the polling unit results."))
+
+# polling_results/management/commands/ingest_results.py
+import os
+from django.core.management.base import BaseCommand, CommandError
+from polling_results.ingestion import (
+    DEFAULT_BATCH_SIZE, ingest_polling_unit_results, read_units_csv, read_units_json,
+)
+
+class Command(BaseCommand):
+    help = "Load polling units and their party scores from a CSV or JSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['csv', 'json'],
+                            help="File format; guessed from the extension when omitted")
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or os.path.splitext(path)[1].lstrip('.').lower()
+        readers = {'csv': read_units_csv, 'json': read_units_json}
+        if file_format not in readers:
+            raise CommandError(f"Cannot tell the format of {path}; pass --format")
+
+        with open(path, newline='', encoding='utf-8') as fileobj:
+            try:
+                created = ingest_polling_unit_results(readers[file_format](fileobj), options['batch_size'])
+            except ValueError as exc:
+                raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(f"Loaded {created} polling units."))
+
+# polling_results/management/commands/reconcile_lgas.py
+import time
+from django.core.management.base import BaseCommand
+from polling_results.reconciliation import reconcile_all_lgas, reconcile_pending_lgas
+
+class Command(BaseCommand):
+    help = "Compare announced LGA results with the sum of their polling unit results"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help="Recheck every LGA instead of only those changed since the last run")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        found = reconcile_all_lgas() if options['all'] else reconcile_pending_lgas()
+        self.stdout.write(f"{found} discrepancies found in {time.perf_counter() - started:.2f} s.")
+
+# polling_results/management/commands/export_results.py
+from django.core.management.base import BaseCommand, CommandError
+from polling_results.export import EXPORT_FORMATS, EXPORT_LEVELS, export_results
+
+class Command(BaseCommand):
+    help = "Stream polling unit or rolled-up results to a CSV or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--level', choices=list(EXPORT_LEVELS), default='polling_unit')
+        parser.add_argument('--format', choices=list(EXPORT_FORMATS), default='csv')
+        parser.add_argument('--output', help="File to write to; standard output when omitted")
+
+    def handle(self, *args, **options):
+        chunks = export_results(options['level'], options['format'])
+        if not options['output']:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+        try:
+            with open(options['output'], 'w', newline='', encoding='utf-8') as output:
+                for chunk in chunks:
+                    output.write(chunk)
+        except OSError as exc:
+            raise CommandError(str(exc))
+        self.stderr.write(f"Wrote {options['level']} results to {options['output']}.")
+
+# polling_results/tests.py
+import io
+from unittest import mock
+from django.core.cache import cache
+from asgiref.sync import sync_to_async
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.test import TestCase, TransactionTestCase, modify_settings, override_settings
+from django.urls import reverse
+from .models import (
+    State, LGA, Ward, PollingUnit, Party, AnnouncedPuResult, AnnouncedLgaResult,
+    WardResultRollup, LgaResultRollup, StateResultRollup, LgaDiscrepancy, LgaRecheck,
+)
+from .export import async_chunks, export_results
+from . import instrumentation
+from .ingestion import ingest_polling_unit_results, read_units_json
+from .reconciliation import reconcile_pending_lgas
+from .live import websocket_urlpatterns
+from .cache import PARTY_VERSION, invalidate
+from .parties import invalidate_parties, party_score_fields
+from .rollups import verify_rollups
+from .views import NewResultForm
+
+class RollupTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        first_ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        second_ward = Ward.objects.create(ward_id=2, ward_name='Ward 2', lga=lga)
+        self.first_unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=first_ward)
+        self.second_unit = PollingUnit.objects.create(polling_unit_id=2, polling_unit_name='PU 2', ward=second_ward)
+        Party.objects.bulk_create([Party(party_id=1, party_name='PDP'), Party(party_id=2, party_name='APC')])
+
+    def totals(self, model, **lookup):
+        return dict(model.objects.filter(**lookup).values_list('party_id', 'total_score'))
+
+    def test_save_update_and_delete_apply_deltas(self):
+        first = AnnouncedPuResult.objects.create(polling_unit=self.first_unit, party_id=1, party_score=10)
+        second = AnnouncedPuResult.objects.create(polling_unit=self.second_unit, party_id=1, party_score=5)
+        self.assertEqual(self.totals(LgaResultRollup, lga_id=1), {1: 15})
+
+        first.party_score = 4
+        first.save()
+        self.assertEqual(self.totals(WardResultRollup, ward_id=1), {1: 4})
+        second.party_id = 2
+        second.save()
+        self.assertEqual(self.totals(LgaResultRollup, lga_id=1), {1: 4, 2: 5})
+        first.delete()
+        self.assertEqual(self.totals(StateResultRollup, state_id=1), {1: 0, 2: 5})
+        self.assertEqual(verify_rollups(), [])
+
+    def test_deferred_results_are_not_reloaded(self):
+        result = AnnouncedPuResult.objects.create(polling_unit=self.first_unit, party_id=1, party_score=10)
+        with self.assertNumQueries(1):
+            list(AnnouncedPuResult.objects.only('result_id'))
+
+        deferred = AnnouncedPuResult.objects.only('result_id', 'party_score').get(pk=result.pk)
+        deferred.party_score = 3
+        deferred.save()
+        self.assertEqual(self.totals(StateResultRollup, state_id=1), {1: 3})
+        AnnouncedPuResult.objects.defer('party_score').get(pk=result.pk).delete()
+        self.assertEqual(self.totals(StateResultRollup, state_id=1), {1: 0})
+        self.assertEqual(verify_rollups(), [])
+
+    def test_verify_rollups_reports_drift(self):
+        AnnouncedPuResult.objects.create(polling_unit=self.first_unit, party_id=1, party_score=10)
+        StateResultRollup.objects.update(total_score=7)
+        self.assertEqual(verify_rollups(), [('state', 1, 1, 7, 10)])
+
+class CascadeDeleteTests(TransactionTestCase):
+    # Real commits, so the foreign keys are checked and on_commit handlers run
+    def setUp(self):
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        first_ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        second_ward = Ward.objects.create(ward_id=2, ward_name='Ward 2', lga=lga)
+        first_unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=first_ward)
+        second_unit = PollingUnit.objects.create(polling_unit_id=2, polling_unit_name='PU 2', ward=second_ward)
+        Party.objects.bulk_create([Party(party_id=1, party_name='PDP'), Party(party_id=2, party_name='APC')])
+        AnnouncedPuResult.objects.create(polling_unit=first_unit, party_id=1, party_score=10)
+        AnnouncedPuResult.objects.create(polling_unit=first_unit, party_id=2, party_score=3)
+        AnnouncedPuResult.objects.create(polling_unit=second_unit, party_id=1, party_score=5)
+        AnnouncedLgaResult.objects.create(lga=lga, party_id=1, party_score=15)
+
+    def totals(self, model, **lookup):
+        return dict(model.objects.filter(**lookup).values_list('party_id', 'total_score'))
+
+    def test_deleting_a_ward_keeps_the_lga_and_state_totals_right(self):
+        Ward.objects.get(pk=1).delete()
+        self.assertEqual(self.totals(LgaResultRollup, lga_id=1), {1: 5, 2: 0})
+        self.assertEqual(self.totals(StateResultRollup, state_id=1), {1: 5, 2: 0})
+        self.assertEqual(verify_rollups(), [])
+
+    def test_deleting_an_lga_keeps_the_state_totals_right(self):
+        LGA.objects.get(pk=1).delete()
+        self.assertEqual(self.totals(StateResultRollup, state_id=1), {1: 0, 2: 0})
+        self.assertFalse(LgaRecheck.objects.exists())
+        self.assertEqual(verify_rollups(), [])
+
+    def test_deleting_a_party_removes_its_rollups(self):
+        Party.objects.get(pk=1).delete()
+        self.assertEqual(self.totals(LgaResultRollup, lga_id=1), {2: 3})
+        self.assertEqual(verify_rollups(), [])
+
+class PollingUnitResultQueryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        self.ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        self.unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=self.ward)
+
+    def add_parties(self, first_id, count):
+        for party_id in range(first_id, first_id + count):
+            party = Party.objects.create(party_id=party_id, party_name=f'P{party_id}')
+            AnnouncedPuResult.objects.create(polling_unit=self.unit, party=party, party_score=party_id)
+
+    def add_units(self, first_id, count):
+        PollingUnit.objects.bulk_create([
+            PollingUnit(polling_unit_id=unit_id, polling_unit_name=f'PU {unit_id}', ward=self.ward)
+            for unit_id in range(first_id, first_id + count)
+        ])
+
+    def assert_page_queries(self, expected):
+        cache.clear()
+        with self.assertNumQueries(expected):
+            response = self.client.get(reverse('polling_unit_result'), {'polling_unit': self.unit.pk})
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_query_count_does_not_grow_with_parties_or_units(self):
+        self.add_parties(1, 2)
+        self.add_units(2, 2)
+        # One query for the unit, one for the results joined with their party
+        self.assert_page_queries(2)
+
+        self.add_parties(3, 10)
+        self.add_units(4, 50)
+        response = self.assert_page_queries(2)
+        self.assertContains(response, 'P12')
+
+    def test_cached_page_needs_no_queries(self):
+        self.add_parties(1, 3)
+        self.client.get(reverse('polling_unit_result'), {'polling_unit': self.unit.pk})
+        with self.assertNumQueries(0):
+            self.client.get(reverse('polling_unit_result'), {'polling_unit': self.unit.pk})
+
+    def test_saved_result_moves_the_cached_version(self):
+        self.add_parties(1, 1)
+        url = reverse('polling_unit_result')
+        self.client.get(url, {'polling_unit': '1'})
+        # '01' is the same unit, so it is served from the same entry
+        with self.assertNumQueries(0):
+            self.client.get(url, {'polling_unit': '01'})
+        result = AnnouncedPuResult.objects.get(polling_unit=self.unit)
+        result.party_score = 77
+        with self.captureOnCommitCallbacks(execute=True):
+            result.save()
+        self.assertContains(self.client.get(url, {'polling_unit': '01'}), '<td>77</td>')
+
+    def test_renamed_party_shows_on_cached_pages(self):
+        self.add_parties(1, 1)
+        url = reverse('polling_unit_result')
+        self.client.get(url, {'polling_unit': self.unit.pk})
+        party = Party.objects.get(pk=1)
+        party.party_name = 'Renamed'
+        party.save()
+        self.assertContains(self.client.get(url, {'polling_unit': self.unit.pk}), 'Renamed')
+
+    def test_rejects_non_numeric_ids(self):
+        self.assertEqual(self.client.get(reverse('polling_unit_result'), {'polling_unit': 'x'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('lga_result'), {'lga': '1 OR 1=1'}).status_code, 400)
+
+class PollingUnitApiTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        other_lga = LGA.objects.create(lga_id=2, lga_name='Ughelli', state=state)
+        ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        other_ward = Ward.objects.create(ward_id=2, ward_name='Ward 2', lga=other_lga)
+        PollingUnit.objects.bulk_create(
+            [PollingUnit(polling_unit_id=i, polling_unit_name=f'School {i}', ward=ward) for i in range(1, 6)]
+            + [PollingUnit(polling_unit_id=i, polling_unit_name=f'Market {i}', ward=other_ward) for i in range(6, 9)]
+        )
+
+    def get_page(self, **params):
+        response = self.client.get(reverse('polling_unit_api'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_keyset_pages_cover_every_unit_once(self):
+        seen = []
+        page = self.get_page(limit=3)
+        while True:
+            seen.extend(item['id'] for item in page['results'])
+            if page['next'] is None:
+                break
+            page = self.get_page(limit=3, after=page['next'])
+        self.assertEqual(seen, list(range(1, 9)))
+
+    def test_prefix_search_and_lga_filter(self):
+        self.assertEqual([item['id'] for item in self.get_page(q='market')['results']], [6, 7, 8])
+        self.assertEqual([item['id'] for item in self.get_page(lga=1, q='School 1')['results']], [1])
+
+    def test_rejects_bad_parameters(self):
+        self.assertEqual(self.client.get(reverse('polling_unit_api'), {'limit': 'all'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('polling_unit_api'), {'limit': 0}).status_code, 400)
+
+class IngestionTests(TestCase):
+    def setUp(self):
+        invalidate_parties()
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        self.ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        Party.objects.create(party_id=1, party_name='PDP')
+
+    def unit(self, name, unit_id=None, score=5):
+        return {'polling_unit_id': unit_id, 'polling_unit_name': name, 'ward_id': self.ward.pk, 'scores': {1: score}}
+
+    def test_explicit_ids_are_never_allocated_again(self):
+        ingest_polling_unit_results([self.unit('A', unit_id=10), self.unit('B')])
+        ingest_polling_unit_results([self.unit('C')])
+        self.assertEqual(
+            list(PollingUnit.objects.order_by('pk').values_list('polling_unit_name', 'pk')),
+            [('A', 10), ('B', 11), ('C', 12)],
+        )
+        self.assertEqual(WardResultRollup.objects.get(ward=self.ward, party_id=1).total_score, 15)
+
+    def test_units_created_outside_the_sequence_are_skipped(self):
+        ingest_polling_unit_results([self.unit('A')])
+        PollingUnit.objects.create(polling_unit_id=2, polling_unit_name='Admin', ward=self.ward)
+        ingest_polling_unit_results([self.unit('B')])
+        self.assertEqual(PollingUnit.objects.get(polling_unit_name='B').pk, 3)
+
+    def test_failed_batch_writes_nothing(self):
+        PollingUnit.objects.create(polling_unit_id=10, polling_unit_name='Existing', ward=self.ward)
+        with self.assertRaises(ValueError):
+            ingest_polling_unit_results([self.unit('A'), self.unit('B', unit_id=10)])
+        self.assertEqual(PollingUnit.objects.count(), 1)
+        self.assertFalse(AnnouncedPuResult.objects.exists())
+        self.assertFalse(WardResultRollup.objects.exists())
+
+    def test_json_ids_are_read_as_integers(self):
+        source = io.StringIO('[{"polling_unit_id": "7", "polling_unit_name": "A", "ward_id": "1", "scores": {"PDP": 3}}]')
+        self.assertEqual(list(read_units_json(source)), [
+            {'polling_unit_id': 7, 'polling_unit_name': 'A', 'ward_id': 1, 'scores': {1: 3}},
+        ])
+
+class ReconciliationTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=ward)
+        party = Party.objects.create(party_id=1, party_name='PDP')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.result = AnnouncedPuResult.objects.create(polling_unit=unit, party=party, party_score=10)
+        AnnouncedLgaResult.objects.create(lga=lga, party=party, party_score=12)
+
+    def test_pending_run_records_discrepancies_and_empties_the_queue(self):
+        self.assertEqual(list(LgaRecheck.objects.values_list('lga_id', flat=True)), [1])
+        self.assertEqual(reconcile_pending_lgas(), 1)
+        self.assertEqual(
+            list(LgaDiscrepancy.objects.values_list('lga_id', 'party_id', 'announced_score', 'computed_score')),
+            [(1, 1, 12, 10)],
+        )
+        self.assertFalse(LgaRecheck.objects.exists())
+
+    def test_corrected_result_requeues_and_clears_the_discrepancy(self):
+        reconcile_pending_lgas()
+        self.result.party_score = 12
+        with self.captureOnCommitCallbacks(execute=True):
+            self.result.save()
+        self.assertTrue(LgaRecheck.objects.filter(lga_id=1).exists())
+        self.assertEqual(reconcile_pending_lgas(), 0)
+        self.assertFalse(LgaDiscrepancy.objects.exists())
+
+    def test_failed_run_leaves_the_queue_in_place(self):
+        with mock.patch('polling_results.reconciliation.reconcile_lgas', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                reconcile_pending_lgas()
+        self.assertTrue(LgaRecheck.objects.filter(lga_id=1).exists())
+
+class ExportTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=ward)
+        party = Party.objects.create(party_id=1, party_name='PDP')
+        AnnouncedPuResult.objects.create(polling_unit=unit, party=party, party_score=10)
+
+    def test_header_is_sent_before_the_rows(self):
+        chunks = list(export_results('polling_unit', 'csv'))
+        self.assertEqual(chunks, ['polling_unit_id,polling_unit_name,party,score\r\n', '1,PU 1,PDP,10\r\n'])
+
+    async def test_async_stream_matches_the_sync_export(self):
+        expected = await sync_to_async(lambda: list(export_results('state', 'ndjson')))()
+        streamed = [chunk async for chunk in async_chunks(export_results('state', 'ndjson'))]
+        self.assertEqual(streamed, expected)
+
+class PartyRegistryTests(TestCase):
+    def setUp(self):
+        # Test rollbacks do not send post_delete, so start from an empty registry
+        invalidate_parties()
+        Party.objects.create(party_id=1, party_name='PDP')
+
+    def test_form_needs_no_party_queries_once_loaded(self):
+        NewResultForm()
+        with self.assertNumQueries(0):
+            form = NewResultForm(data={'party_1': '4'})
+            form.is_valid()
+        self.assertIn('party_1', form.fields)
+        self.assertIsNot(form.fields['party_1'], party_score_fields()['party_1'])
+
+    def test_saving_a_party_reloads_the_fields(self):
+        NewResultForm()
+        Party.objects.create(party_id=2, party_name='APC')
+        self.assertIn('party_2', NewResultForm().fields)
+
+    def test_change_in_another_process_reloads_the_fields(self):
+        NewResultForm()
+        # Another process only bumps the shared version key
+        Party.objects.bulk_create([Party(party_id=2, party_name='APC')])
+        invalidate(*PARTY_VERSION)
+        self.assertIn('party_2', NewResultForm().fields)
+
+class StateDashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=ward)
+        party = Party.objects.create(party_id=1, party_name='PDP')
+        AnnouncedPuResult.objects.create(polling_unit=unit, party=party, party_score=10)
+
+    def test_unchanged_dashboard_is_not_modified(self):
+        url = reverse('state_dashboard_api', args=[1])
+        response = self.client.get(url)
+        self.assertEqual(response.json()['lgas'][0]['totals'], [{'party': 'PDP', 'total_score': 10}])
+        # Only the updated_at lookup
+        with self.assertNumQueries(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_renamed_party_changes_the_etag(self):
+        url = reverse('state_dashboard_api', args=[1])
+        etag = self.client.get(url)['ETag']
+        party = Party.objects.get(pk=1)
+        party.party_name = 'Peoples Democratic Party'
+        party.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['state']['totals'][0]['party'], 'Peoples Democratic Party')
+
+    def test_rejects_bad_paging_parameters(self):
+        response = self.client.get(reverse('state_dashboard_api', args=[1]), {'limit': 'all'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {'error': "after and limit must be integers"})
+
+    def test_new_results_change_the_etag(self):
+        url = reverse('state_dashboard_api', args=[1])
+        etag = self.client.get(url)['ETag']
+        unit = PollingUnit.objects.create(polling_unit_id=2, polling_unit_name='PU 2', ward_id=1)
+        AnnouncedPuResult.objects.create(polling_unit=unit, party_id=1, party_score=5)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['state']['totals'], [{'party': 'PDP', 'total_score': 15}])
+
+@modify_settings(MIDDLEWARE={'append': 'polling_results.instrumentation.QueryTimingMiddleware'})
+class InstrumentationTests(TestCase):
+    def setUp(self):
+        instrumentation._metrics.clear()
+        state = State.objects.create(state_id=1, state_name='Delta')
+        lga = LGA.objects.create(lga_id=1, lga_name='Oshimili', state=state)
+        ward = Ward.objects.create(ward_id=1, ward_name='Ward 1', lga=lga)
+        unit = PollingUnit.objects.create(polling_unit_id=1, polling_unit_name='PU 1', ward=ward)
+        party = Party.objects.create(party_id=1, party_name='PDP')
+        AnnouncedPuResult.objects.create(polling_unit=unit, party=party, party_score=10)
+
+    def test_requests_are_recorded_per_view(self):
+        response = self.client.get(reverse('lga_api'))
+        recorded = instrumentation._metrics['lga_api']
+        self.assertEqual(recorded.requests, 1)
+        self.assertGreater(recorded.queries, 0)
+        self.assertEqual(recorded.response_bytes.total, len(response.content))
+
+    def test_streamed_queries_are_counted_once_the_body_is_sent(self):
+        response = self.client.get(reverse('export_results', args=['polling_unit']))
+        self.assertNotIn('export_results', instrumentation._metrics)
+        body = b''.join(response.streaming_content)
+        recorded = instrumentation._metrics['export_results']
+        self.assertGreater(recorded.queries, 0)
+        self.assertEqual(recorded.response_bytes.total, len(body))
+
+    def test_over_budget_request_logs_the_slowest_sql(self):
+        with mock.patch.object(instrumentation, 'QUERY_BUDGET', 0), \
+                self.assertLogs('polling_results.instrumentation', 'WARNING') as logs:
+            self.client.get(reverse('lga_api'))
+        self.assertIn('GET /api/lgas/ (lga_api) over budget', logs.output[0])
+        self.assertIn('SELECT', logs.output[0])
+
+    def test_metrics_are_served_in_prometheus_format(self):
+        self.client.get(reverse('lga_api'))
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4')
+        lines = response.content.decode().splitlines()
+        self.assertIn('# TYPE polling_results_requests_total counter', lines)
+        self.assertIn('polling_results_requests_total{view="lga_api"} 1', lines)
+        self.assertIn('polling_results_request_duration_seconds_count{view="lga_api"} 1', lines)
+
+    def test_metrics_are_not_served_to_remote_clients(self):
+        response = self.client.get(reverse('metrics'), REMOTE_ADDR='203.0.113.5')
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(POLLING_RESULTS_METRICS_TOKEN='scrape-token')
+    def test_metrics_token_replaces_the_address_check(self):
+        url = reverse('metrics')
+        # Behind a proxy every request looks local
+        self.assertEqual(self.client.get(url).status_code, 404)
+        response = self.client.get(url, REMOTE_ADDR='203.0.113.5', HTTP_AUTHORIZATION='Bearer scrape-token')
+        self.assertEqual(response.status_code, 200)
+
+class LiveResultsTests(TestCase):
+    def setUp(self):
+        state = State.objects.create(state_id=1, state_name='Delta')
+        for lga_id in (7, 8):
+            lga = LGA.objects.create(lga_id=lga_id, lga_name=f'LGA {lga_id}', state=state)
+            Ward.objects.create(ward_id=lga_id, ward_name=f'Ward {lga_id}', lga=lga)
+        Party.objects.create(party_id=1, party_name='PDP')
+
+    def ingest(self):
+        # One batch touching both LGAs, delivered the way a real commit does
+        with self.captureOnCommitCallbacks(execute=True):
+            ingest_polling_unit_results([
+                {'polling_unit_id': 3, 'polling_unit_name': 'PU 3', 'ward_id': 7, 'scores': {1: 5}},
+                {'polling_unit_id': 4, 'polling_unit_name': 'PU 4', 'ward_id': 8, 'scores': {1: 2}},
+            ])
+
+    @override_settings(CHANNEL_LAYERS={'default': {'BACKEND': 'channels.layers.InMemoryChannelLayer'}})
+    async def test_lga_subscriber_receives_committed_deltas(self):
+        communicator = WebsocketCommunicator(URLRouter(websocket_urlpatterns), '/ws/results/lga/7/')
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+
+        await sync_to_async(self.ingest)()
+        self.assertEqual(await communicator.receive_json_from(), {
+            'kind': 'lga', 'id': 7, 'changes': [{'party_id': 1, 'delta': 5}],
+        })
+        # Nothing for LGA 8 reaches this subscriber
+        self.assertTrue(await communicator.receive_nothing())
+        await communicator.disconnect()
+
 # Now let's create templates for each view
 
 # polling_results/templates/polling_results/polling_unit_result.html
@@ -182,7 +2556,7 @@ urlpatterns = [
         body { font-family: Arial, sans-serif; margin: 20px; }
         h1 { color: #333; }
         .form-group { margin-bottom: 15px; }
-        select { padding: 8px; width: 300px; }
+        input, select { padding: 8px; width: 300px; }
         button { padding: 8px 15px; background: #4CAF50; color: white; border: none; cursor: pointer; }
         table { border-collapse: collapse; width: 100%; margin-top: 20px; }
         th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
@@ -194,19 +2568,67 @@ urlpatterns = [
     <h1>Individual Polling Unit Results</h1>
     
     <form method="get">
+        <div class="form-group">
+            <label for="polling_unit_search">Search Polling Units:</label>
+            <input type="text" id="polling_unit_search" placeholder="Start of the polling unit name">
+        </div>
         <div class="form-group">
             <label for="polling_unit">Select Polling Unit:</label>
-            <select name="polling_unit" id="polling_unit">
+            <select name="polling_unit" id="polling_unit" data-source="{% url 'polling_unit_api' %}">
                 <option value="">-- Select a Polling Unit --</option>
-                {% for unit in polling_units %}
-                    <option value="{{ unit.polling_unit_id }}" {% if request.GET.polling_unit == unit.polling_unit_id|stringformat:"s" %}selected{% endif %}>
-                        {{ unit.polling_unit_name }}
+                {% if selected_unit %}
+                    <option value="{{ selected_unit.polling_unit_id }}" selected>
+                        {{ selected_unit.polling_unit_name }}
                     </option>
-                {% endfor %}
+                {% endif %}
             </select>
+            <button type="button" id="polling_unit_more">Load more</button>
         </div>
         <button type="submit">View Results</button>
     </form>
+    <script>
+        // Fill the dropdown page by page from the JSON API as the user searches
+        (function () {
+            var select = document.getElementById('polling_unit');
+            var search = document.getElementById('polling_unit_search');
+            var more = document.getElementById('polling_unit_more');
+            var next = null;
+            var timer = null;
+
+            function load(reset) {
+                var params = new URLSearchParams({q: search.value});
+                if (!reset && next !== null) {
+                    params.set('after', next);
+                }
+                fetch(select.dataset.source + '?' + params).then(function (response) {
+                    return response.json();
+                }).then(function (page) {
+                    if (reset) {
+                        // Keep the placeholder and the current selection
+                        Array.from(select.options).forEach(function (option) {
+                            if (option.value && !option.selected) {
+                                option.remove();
+                            }
+                        });
+                    }
+                    page.results.forEach(function (item) {
+                        if (!select.querySelector('option[value="' + item.id + '"]')) {
+                            select.add(new Option(item.name, item.id));
+                        }
+                    });
+                    next = page.next;
+                    more.style.display = next === null ? 'none' : '';
+                });
+            }
+
+            search.addEventListener('input', function () {
+                clearTimeout(timer);
+                timer = setTimeout(function () { load(true); }, 250);
+            });
+            more.addEventListener('click', function () { load(false); });
+            load(true);
+        })();
+    </script>
     
     {% if results %}
         <h2>Results:</h2>
@@ -243,7 +2665,7 @@ urlpatterns = [
         body { font-family: Arial, sans-serif; margin: 20px; }
         h1 { color: #333; }
         .form-group { margin-bottom: 15px; }
-        select { padding: 8px; width: 300px; }
+        input, select { padding: 8px; width: 300px; }
         button { padding: 8px 15px; background: #4CAF50; color: white; border: none; cursor: pointer; }
         table { border-collapse: collapse; width: 100%; margin-top: 20px; }
         th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
@@ -255,19 +2677,67 @@ urlpatterns = [
     <h1>Summed Polling Unit Results by LGA</h1>
     
     <form method="get">
+        <div class="form-group">
+            <label for="lga_search">Search LGAs:</label>
+            <input type="text" id="lga_search" placeholder="Start of the LGA name">
+        </div>
         <div class="form-group">
             <label for="lga">Select Local Government Area:</label>
-            <select name="lga" id="lga">
+            <select name="lga" id="lga" data-source="{% url 'lga_api' %}">
                 <option value="">-- Select an LGA --</option>
-                {% for lga in lgas %}
-                    <option value="{{ lga.lga_id }}" {% if request.GET.lga == lga.lga_id|stringformat:"s" %}selected{% endif %}>
-                        {{ lga.lga_name }}
+                {% if selected_lga %}
+                    <option value="{{ selected_lga.lga_id }}" selected>
+                        {{ selected_lga.lga_name }}
                     </option>
-                {% endfor %}
+                {% endif %}
             </select>
+            <button type="button" id="lga_more">Load more</button>
         </div>
         <button type="submit">View Results</button>
     </form>
+    <script>
+        // Fill the dropdown page by page from the JSON API as the user searches
+        (function () {
+            var select = document.getElementById('lga');
+            var search = document.getElementById('lga_search');
+            var more = document.getElementById('lga_more');
+            var next = null;
+            var timer = null;
+
+            function load(reset) {
+                var params = new URLSearchParams({q: search.value});
+                if (!reset && next !== null) {
+                    params.set('after', next);
+                }
+                fetch(select.dataset.source + '?' + params).then(function (response) {
+                    return response.json();
+                }).then(function (page) {
+                    if (reset) {
+                        // Keep the placeholder and the current selection
+                        Array.from(select.options).forEach(function (option) {
+                            if (option.value && !option.selected) {
+                                option.remove();
+                            }
+                        });
+                    }
+                    page.results.forEach(function (item) {
+                        if (!select.querySelector('option[value="' + item.id + '"]')) {
+                            select.add(new Option(item.name, item.id));
+                        }
+                    });
+                    next = page.next;
+                    more.style.display = next === null ? 'none' : '';
+                });
+            }
+
+            search.addEventListener('input', function () {
+                clearTimeout(timer);
+                timer = setTimeout(function () { load(true); }, 250);
+            });
+            more.addEventListener('click', function () { load(false); });
+            load(true);
+        })();
+    </script>
     
     {% if summed_results %}
         <h2>Results for {{ selected_lga.lga_name }} LGA:</h2>
@@ -294,6 +2764,124 @@ urlpatterns = [
 </html>
 """
 
+# polling_results/templates/polling_results/lga_reconciliation.html
+"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>LGA Reconciliation</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        table { border-collapse: collapse; width: 100%; margin-top: 20px; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+    </style>
+</head>
+<body>
+    <h1>Announced vs Computed LGA Results</h1>
+    
+    {% if pending_count %}
+        <p>{{ pending_count }} LGA(s) changed since the last reconciliation run.</p>
+    {% endif %}
+    
+    {% if discrepancies %}
+        <table>
+            <thead>
+                <tr>
+                    <th>LGA</th>
+                    <th>Party</th>
+                    <th>Announced</th>
+                    <th>Sum of Polling Units</th>
+                    <th>Checked</th>
+                </tr>
+            </thead>
+            <tbody>
+                {% for discrepancy in discrepancies %}
+                    <tr>
+                        <td>{{ discrepancy.lga.lga_name }}</td>
+                        <td>{{ discrepancy.party.party_name }}</td>
+                        <td>{{ discrepancy.announced_score|default_if_none:"-" }}</td>
+                        <td>{{ discrepancy.computed_score|default_if_none:"-" }}</td>
+                        <td>{{ discrepancy.checked_at }}</td>
+                    </tr>
+                {% endfor %}
+            </tbody>
+        </table>
+    {% else %}
+        <p>No discrepancies found.</p>
+    {% endif %}
+</body>
+</html>
+"""
+
+# polling_results/templates/polling_results/state_dashboard.html
+"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>{{ dashboard.state.state_name }} Dashboard</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333; }
+        .lgas { display: flex; flex-wrap: wrap; }
+        .lga { width: 300px; margin: 10px; }
+        table { border-collapse: collapse; width: 100%; margin-top: 10px; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        tr:nth-child(even) { background-color: #f9f9f9; }
+    </style>
+</head>
+<body>
+    <h1>{{ dashboard.state.state_name }} Results</h1>
+    
+    <h2>State Total</h2>
+    <table>
+        <thead>
+            <tr>
+                <th>Party</th>
+                <th>Total Score</th>
+            </tr>
+        </thead>
+        <tbody>
+            {% for total in dashboard.state.totals %}
+                <tr>
+                    <td>{{ total.party }}</td>
+                    <td>{{ total.total_score }}</td>
+                </tr>
+            {% empty %}
+                <tr><td colspan="2">No results yet.</td></tr>
+            {% endfor %}
+        </tbody>
+    </table>
+    
+    <h2>Local Government Areas</h2>
+    <div class="lgas">
+        {% for lga in dashboard.lgas %}
+            <div class="lga">
+                <h3>{{ lga.lga_name }}</h3>
+                <table>
+                    {% for total in lga.totals %}
+                        <tr>
+                            <td>{{ total.party }}</td>
+                            <td>{{ total.total_score }}</td>
+                        </tr>
+                    {% empty %}
+                        <tr><td>No results yet.</td></tr>
+                    {% endfor %}
+                </table>
+            </div>
+        {% endfor %}
+    </div>
+    
+    {% if dashboard.next %}
+        <p><a href="?after={{ dashboard.next }}">Next LGAs</a></p>
+    {% endif %}
+</body>
+</html>
+"""
+
 # polling_results/templates/polling_results/new_polling_unit.html
 """
 <!DOCTYPE html>
@@ -343,6 +2931,22 @@ urlpatterns = [
 </html>
 """
 
+# election_project/asgi.py
+import os
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'election_project.settings')
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter
+from channels.security.websocket import AllowedHostsOriginValidator
+from polling_results.live import websocket_urlpatterns
+
+application = ProtocolTypeRouter({
+    'http': django_asgi_app,
+    'websocket': AllowedHostsOriginValidator(URLRouter(websocket_urlpatterns)),
+})
+
 # election_project/urls.py
 from django.contrib import admin
 from django.urls import path, include
@@ -1,8 +1,24 @@
+import abc
+import atexit
+import bisect
 import collections
-import statistics
+import contextlib
+import functools
+import hashlib
+import json
+import mmap
+import os
 import random
-import psycopg2
-from typing import List, Dict, Union, Optional
+import sqlite3
+import threading
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+try:
+    import numpy
+except ImportError:  # Optional: search_many falls back to pure Python
+    numpy = None
+from typing import List, Dict, Union, Optional, Iterable, Iterator, Tuple, Mapping, Callable, Sequence
 
 # Data from the table
 color_data = {
@@ -22,22 +38,113 @@ color_data = {
               'RED', 'RED', 'RED', 'WHITE', 'BLUE', 'WHITE', 'BLUE', 'BLUE', 'BLUE', 'WHITE']
 }
 
+# Known typos and their corrections
+TYPO_FIXES = {
+    'ARSH': 'HARSH',  # Assuming ARSH is a typo for HARSH
+    'BLEW': 'BLUE',  # BLEW is likely BLUE
+}
+
+def standardize_color(color: str) -> str:
+    """Fix a single color name if it is a known typo."""
+    return TYPO_FIXES.get(color, color)
+
 # Standardize color names (fix typos)
 def standardize_colors(data: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """Standardize color names by fixing typos."""
-    standardized_data = {}
-    for day, colors in data.items():
-        standardized_colors = []
-        for color in colors:
-            # Fix known typos
-            if color == 'ARSH':
-                standardized_colors.append('HARSH')  # Assuming ARSH is a typo for HARSH
-            elif color == 'BLEW':
-                standardized_colors.append('BLUE')  # BLEW is likely BLUE
-            else:
-                standardized_colors.append(color)
-        standardized_data[day] = standardized_colors
-    return standardized_data
+    return {day: [standardize_color(color) for color in colors] for day, colors in data.items()}
+
+# Configurable normalization with optional fuzzy typo correction
+DEFAULT_PALETTE = ('BLACK', 'BLUE', 'BROWN', 'CREAM', 'GREEN', 'HARSH', 'ORANGE', 'PINK', 'RED', 'WHITE', 'YELLOW')
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between a and b. When limit is given, stops early and
+    returns limit + 1 as soon as the distance is known to exceed it.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+class ColorNormalizer:
+    """
+    Normalize color names: upper-case them, apply an explicit typo mapping,
+    then (when a palette is given) snap unknown names to the unique palette
+    color within max_distance edits. Results are memoized per distinct name,
+    so large batches cost one lookup per observation.
+    """
+
+    def __init__(self, mapping: Optional[Mapping[str, str]] = None,
+                 palette: Optional[Iterable[str]] = None, max_distance: int = 1):
+        self.mapping = dict(TYPO_FIXES if mapping is None else mapping)
+        self.palette = tuple(sorted(set(palette))) if palette is not None else ()
+        self.max_distance = max_distance
+        self._cache: Dict[str, str] = {}
+
+    def _resolve(self, color: str) -> str:
+        name = color.strip().upper()
+        name = self.mapping.get(name, name)
+        if not self.palette or name in self.palette:
+            return name
+        distances = [(edit_distance(name, known, self.max_distance), known) for known in self.palette]
+        best = min(distance for distance, _ in distances)
+        matches = [known for distance, known in distances if distance == best]
+        # Leave the name alone when nothing is close or the match is ambiguous
+        if best > self.max_distance or len(matches) > 1:
+            return name
+        return matches[0]
+
+    def __call__(self, color: str) -> str:
+        try:
+            return self._cache[color]
+        except KeyError:
+            normalized = self._cache[color] = self._resolve(color)
+            return normalized
+
+    def normalize_batch(self, colors: Iterable[str]) -> List[str]:
+        """Normalize many colors; each distinct name is resolved once."""
+        return [self(color) for color in colors]
+
+    def normalize_categories(self, categories: Sequence[str]) -> Tuple[List[str], List[int]]:
+        """
+        Normalize categorical data (e.g. pandas Categorical categories) without
+        touching the observations. Returns the new categories and a remap table
+        from old to new codes, to apply in bulk: numpy.asarray(remap)[codes].
+        """
+        new_categories: List[str] = []
+        positions: Dict[str, int] = {}
+        remap = []
+        for category in categories:
+            normalized = self(category)
+            if normalized not in positions:
+                positions[normalized] = len(new_categories)
+                new_categories.append(normalized)
+            remap.append(positions[normalized])
+        return new_categories, remap
+
+    def add_mapping(self, typo: str, color: str) -> None:
+        """Teach the normalizer a new typo without a code change."""
+        self.mapping[typo.strip().upper()] = color
+        self._cache.clear()
+
+def count_colors(colors: Iterable[str]) -> collections.Counter:
+    """Count colors; compact ColorView observations are counted without decoding them."""
+    if isinstance(colors, ColorView):
+        return colors.counts()
+    return collections.Counter(colors)
 
 # Flatten the color list for overall analysis
 def get_all_colors(data: Dict[str, List[str]]) -> List[str]:
@@ -50,7 +157,7 @@ def get_all_colors(data: Dict[str, List[str]]) -> List[str]:
 # 1. Calculate the mean color (most frequent color)
 def get_mean_color(colors: List[str]) -> str:
     """Get the mean color (most frequent color)."""
-    counter = collections.Counter(colors)
+    counter = count_colors(colors)
     return counter.most_common(1)[0][0]
 
 # 2. Find the color most worn throughout the week
@@ -61,13 +168,50 @@ def get_most_worn_color(colors: List[str]) -> str:
 # 3. Find the median color
 def get_median_color(colors: List[str]) -> str:
     """Find the median color."""
-    sorted_colors = sorted(colors)
-    return statistics.median(sorted_colors)
+    return color_quantile(count_colors(colors), 0.5)
+
+# Quantiles from frequency counts: a cumulative walk over the sorted distinct colors
+QUANTILE_TIES = ('low', 'high', 'nearest')
+
+def color_quantile(counts: Mapping[str, int], q: float, tie: str = 'low') -> str:
+    """
+    Find the q-quantile (0 <= q <= 1) of the colors in sorted order, given
+    their counts. The quantile sits at position q * (n - 1) of the sorted
+    observations; when that falls between two different colors, tie picks
+    the 'low' one, the 'high' one or the 'nearest' one (low on an exact half).
+    Runs in time proportional to the number of distinct colors.
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("q must be between 0 and 1")
+    if tie not in QUANTILE_TIES:
+        raise ValueError(f"tie must be one of {QUANTILE_TIES}")
+    total = sum(counts.values())
+    if total <= 0:
+        raise ValueError("no colors recorded")
+
+    position = q * (total - 1)
+    low_index = int(position)
+    high_index = min(low_index + 1, total - 1) if position > low_index else low_index
+    if tie == 'low' or (tie == 'nearest' and position - low_index <= 0.5):
+        target = low_index
+    else:
+        target = high_index
+
+    seen = 0
+    for color in sorted(counts):
+        seen += counts[color]
+        if seen > target:
+            return color
+    raise ValueError("counts must not be negative")
+
+def color_quantiles(counts: Mapping[str, int], qs: Iterable[float], tie: str = 'low') -> Dict[float, str]:
+    """Find several quantiles at once."""
+    return {q: color_quantile(counts, q, tie) for q in qs}
 
 # 4. Calculate the variance of the colors
 def get_color_variance(colors: List[str]) -> Dict[str, int]:
     """Calculate the variance of the colors."""
-    counter = collections.Counter(colors)
+    counter = count_colors(colors)
     total_count = len(colors)
     variance = {}
     
@@ -92,43 +236,608 @@ def get_red_probability(colors: List[str]) -> float:
     red_count = colors.count('RED')
     return red_count / total_colors
 
+# Streaming statistics: one pass over (day, color) records, O(distinct colors) memory
+def iter_color_records(data: Dict[str, List[str]]) -> Iterator[Tuple[str, str]]:
+    """Yield (day, color) records from the day -> colors table."""
+    for day, colors in data.items():
+        for color in colors:
+            yield day, color
+
+class ColorStatistics:
+    """
+    Single-pass accumulator for color observations.
+    Colors are standardized as they arrive and only their counts are kept,
+    so every statistic is answered from O(distinct colors) memory.
+    """
+
+    def __init__(self, records: Optional[Iterable[Tuple[str, str]]] = None,
+                 normalize: Callable[[str], str] = standardize_color):
+        self.counts: collections.Counter = collections.Counter()
+        self.total = 0
+        self.normalize = normalize
+        if records is not None:
+            self.update(records)
+
+    def add(self, color: str, count: int = 1) -> None:
+        """Record count observations of color."""
+        self.counts[self.normalize(color)] += count
+        self.total += count
+
+    def update(self, records: Iterable[Tuple[str, str]]) -> None:
+        """Consume an iterator of (day, color) records."""
+        counts = collections.Counter(color for _, color in records)
+        for color, count in counts.items():
+            self.add(color, count)
+
+    def add_counts(self, counts: Mapping[str, int]) -> None:
+        """Add counts of colors that are already standardized."""
+        self.counts.update(counts)
+        self.total += sum(counts.values())
+
+    def mode(self) -> str:
+        """Most frequent color (same as get_mean_color)."""
+        return self.counts.most_common(1)[0][0]
+
+    def median(self, tie: str = 'low') -> str:
+        """Median color in sorted order; see color_quantile for the tie policy."""
+        return color_quantile(self.counts, 0.5, tie)
+
+    def quantile(self, q: float, tie: str = 'low') -> str:
+        """Any quantile of the colors in sorted order."""
+        return color_quantile(self.counts, q, tie)
+
+    def variance(self) -> Dict[str, Union[int, float]]:
+        """Variance of the relative color frequencies (same as get_color_variance)."""
+        distinct = len(self.counts)
+        mean_frequency = 1 / distinct
+        variance_value = sum(
+            (count / self.total - mean_frequency) ** 2 for count in self.counts.values()
+        ) / distinct
+        return {
+            "total_colors": distinct,
+            "variance": variance_value
+        }
+
+    def probability(self, color: str) -> float:
+        """Probability that a randomly chosen observation is color."""
+        return self.counts[self.normalize(color)] / self.total
+
+    def merge(self, other: 'ColorStatistics') -> 'ColorStatistics':
+        """Fold another partial result into this one; its colors are already standardized."""
+        self.counts.update(other.counts)
+        self.total += other.total
+        return self
+
+    def summary(self) -> Dict[str, Union[str, float]]:
+        """The color answers printed by main()."""
+        return {
+            "mean_color": self.mode(),
+            "most_worn_color": self.mode(),
+            "median_color": self.median(),
+            "variance": self.variance()["variance"],
+            "red_probability": self.probability('RED')
+        }
+
+# Precomputed per-day and cross-day analytics, updated one day at a time
+class ColorAnalytics:
+    """
+    Keeps a count vector per day (indexed by palette position), prefix sums
+    of those vectors and the running week totals. Appending a day costs
+    O(distinct colors) and never revisits earlier days; any day range is the
+    difference of two prefix sums.
+    """
+
+    def __init__(self, normalize: Callable[[str], str] = standardize_color):
+        self.normalize = normalize
+        self.palette: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self.days: List[str] = []
+        self._day_index: Dict[str, int] = {}
+        self.day_counts: List[List[int]] = []
+        # prefix_counts[i] holds the totals of days 0..i-1
+        self.prefix_counts: List[List[int]] = [[]]
+        self.rankings: Dict[str, List[Tuple[str, int]]] = {}
+        self.week = ColorStatistics(normalize=normalize)
+
+    def _position(self, color: str) -> int:
+        position = self._positions.get(color)
+        if position is None:
+            position = self._positions[color] = len(self.palette)
+            self.palette.append(color)
+        return position
+
+    @staticmethod
+    def _padded(vector: List[int], size: int) -> List[int]:
+        # Colors first seen after a vector was stored count as zero there
+        return vector + [0] * (size - len(vector))
+
+    def append_day(self, day: str, colors: Iterable[str]) -> None:
+        """Add a day's observations; extending the most recent day is also allowed."""
+        counts = collections.Counter()
+        for color, count in collections.Counter(colors).items():
+            counts[self.normalize(color)] += count
+        for color in counts:
+            self._position(color)
+        size = len(self.palette)
+        vector = [0] * size
+        for color, count in counts.items():
+            vector[self._positions[color]] = count
+
+        if day in self._day_index:
+            if self._day_index[day] != len(self.days) - 1:
+                raise ValueError(f"only the most recent day can be extended, not {day}")
+            self.day_counts[-1] = [a + b for a, b in zip(self._padded(self.day_counts[-1], size), vector)]
+            self.prefix_counts[-1] = [a + b for a, b in zip(self._padded(self.prefix_counts[-1], size), vector)]
+        else:
+            self._day_index[day] = len(self.days)
+            self.days.append(day)
+            self.day_counts.append(vector)
+            self.prefix_counts.append([a + b for a, b in zip(self._padded(self.prefix_counts[-1], size), vector)])
+
+        self.week.add_counts(counts)
+        day_vector = self.day_counts[-1]
+        self.rankings[day] = sorted(
+            ((self.palette[i], count) for i, count in enumerate(day_vector) if count),
+            key=lambda item: (-item[1], item[0])
+        )
+
+    @classmethod
+    def from_data(cls, data: Dict[str, List[str]],
+                  normalize: Callable[[str], str] = standardize_color) -> 'ColorAnalytics':
+        analytics = cls(normalize)
+        for day, colors in data.items():
+            analytics.append_day(day, colors)
+        return analytics
+
+    def day_ranking(self, day: str) -> List[Tuple[str, int]]:
+        """(color, count) pairs for one day, most worn first."""
+        return self.rankings[day]
+
+    def range_counts(self, first_day: str, last_day: str) -> Dict[str, int]:
+        """Color counts over first_day..last_day inclusive, from two prefix sums."""
+        start = self._day_index[first_day]
+        end = self._day_index[last_day] + 1
+        if start >= end:
+            raise ValueError(f"{first_day} comes after {last_day}")
+        size = len(self.palette)
+        upper = self._padded(self.prefix_counts[end], size)
+        lower = self._padded(self.prefix_counts[start], size)
+        return {self.palette[i]: upper[i] - lower[i] for i in range(size) if upper[i] != lower[i]}
+
+    def range_statistics(self, first_day: str, last_day: str) -> ColorStatistics:
+        """Mode, median, variance and probabilities over a day range."""
+        stats = ColorStatistics(normalize=self.normalize)
+        stats.add_counts(self.range_counts(first_day, last_day))
+        return stats
+
+    def mode(self) -> str:
+        return self.week.mode()
+
+    def variance(self) -> Dict[str, Union[int, float]]:
+        return self.week.variance()
+
+    def red_probability(self) -> float:
+        return self.week.probability('RED')
+
+# Parallel map-reduce over days or log file shards
+# Counts (plus their total) are the whole partial result: every statistic,
+# including the variance, is derived from them, and counts simply add up.
+def count_day(day_colors: Tuple[str, List[str]], normalize: Callable[[str], str] = standardize_color) -> ColorStatistics:
+    """Map step: count one day's colors."""
+    day, colors = day_colors
+    partial = ColorStatistics(normalize=normalize)
+    for color, count in collections.Counter(colors).items():
+        partial.add(color, count)
+    return partial
+
+def count_log_range(path: str, start: int, end: int,
+                    normalize: Callable[[str], str] = standardize_color) -> ColorStatistics:
+    """
+    Map step: count the 'DAY,COLOR' lines of a log file that start within the
+    byte range [start, end). Colors are counted as raw bytes and decoded once
+    per distinct value.
+    """
+    raw_counts = collections.Counter()
+    with open(path, 'rb') as log:
+        if start:
+            # A line straddling start belongs to the previous range
+            log.seek(start - 1)
+            log.readline()
+        while log.tell() < end:
+            line = log.readline()
+            if not line:
+                break
+            _, _, color = line.partition(b',')
+            color = color.strip()
+            if color:
+                raw_counts[color] += 1
+    partial = ColorStatistics(normalize=normalize)
+    for color, count in raw_counts.items():
+        partial.add(color.decode(), count)
+    return partial
+
+def merge_statistics(partials: Iterable[ColorStatistics],
+                     normalize: Callable[[str], str] = standardize_color) -> ColorStatistics:
+    """Reduce step: combine partial results."""
+    combined = ColorStatistics(normalize=normalize)
+    for partial in partials:
+        combined.merge(partial)
+    return combined
+
+def parallel_color_statistics(data: Dict[str, List[str]], workers: Optional[int] = None,
+                              normalize: Callable[[str], str] = standardize_color) -> ColorStatistics:
+    """Count each day in its own worker process and merge the results."""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(count_day, data.items(), [normalize] * len(data))
+        return merge_statistics(partials, normalize)
+
+def parallel_log_statistics(path: str, workers: Optional[int] = None, shard_bytes: int = 64 * 1024 * 1024,
+                            normalize: Callable[[str], str] = standardize_color) -> ColorStatistics:
+    """Split a 'DAY,COLOR' log into byte-range shards, count them in parallel and merge."""
+    size = os.path.getsize(path)
+    starts = list(range(0, size, shard_bytes)) or [0]
+    ends = [min(start + shard_bytes, size) for start in starts]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        partials = executor.map(count_log_range, [path] * len(starts), starts, ends, [normalize] * len(starts))
+        return merge_statistics(partials, normalize)
+
+# Compact categorical storage: one byte per observation, persisted and reloaded via mmap
+COUNT_CHUNK_BYTES = 1 << 20
+
+class ColorView:
+    """
+    Read-only sequence of color names over one or more uint8 code buffers.
+    It wraps the buffers without copying them; count() and counts() run at
+    C speed a chunk at a time instead of decoding every observation.
+    """
+
+    def __init__(self, palette: List[str], segments: List[memoryview]):
+        self.palette = palette
+        self.segments = segments
+
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self.segments)
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        for segment in self.segments:
+            if index < len(segment):
+                return self.palette[segment[index]]
+            index -= len(segment)
+        raise IndexError("color index out of range")
+
+    def __iter__(self) -> Iterator[str]:
+        palette = self.palette
+        for segment in self.segments:
+            for code in segment:
+                yield palette[code]
+
+    def code_counts(self) -> List[int]:
+        """Number of observations per palette code."""
+        totals = [0] * len(self.palette)
+        for segment in self.segments:
+            for offset in range(0, len(segment), COUNT_CHUNK_BYTES):
+                chunk = segment[offset:offset + COUNT_CHUNK_BYTES].tobytes()
+                for code in range(len(self.palette)):
+                    totals[code] += chunk.count(code)
+        return totals
+
+    def counts(self) -> collections.Counter:
+        return collections.Counter({
+            self.palette[code]: total for code, total in enumerate(self.code_counts()) if total
+        })
+
+    def count(self, color: str) -> int:
+        if color not in self.palette:
+            return 0
+        return self.counts()[color]
+
+class CompactColorLog:
+    """
+    Color observations interned into a palette of at most 256 names and kept
+    as one byte each (array('B')) per day. save() writes a small JSON header
+    followed by the raw codes; load() maps the file back with mmap, so a
+    reloaded log costs no memory until it is read.
+    """
+
+    def __init__(self, palette: Optional[List[str]] = None):
+        self.palette: List[str] = list(palette or [])
+        self._codes = {color: code for code, color in enumerate(self.palette)}
+        self.days: Dict[str, Union[array, memoryview]] = {}
+        self._mmap = None
+
+    def intern(self, color: str) -> int:
+        """Small-integer code for color, adding it to the palette if new."""
+        code = self._codes.get(color)
+        if code is None:
+            if len(self.palette) == 256:
+                raise ValueError("a compact color log holds at most 256 distinct colors")
+            code = self._codes[color] = len(self.palette)
+            self.palette.append(color)
+        return code
+
+    def extend(self, day: str, colors: Iterable[str],
+               normalize: Callable[[str], str] = standardize_color) -> None:
+        """Append a day's observations, standardizing and interning them."""
+        buffer = self.days.get(day)
+        if not isinstance(buffer, array):
+            # Reloaded days are read-only views; copy before appending
+            buffer = self.days[day] = array('B', buffer or b'')
+        codes: Dict[str, int] = {}
+        for color in colors:
+            code = codes.get(color)
+            if code is None:
+                code = codes[color] = self.intern(normalize(color))
+            buffer.append(code)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, List[str]],
+                  normalize: Callable[[str], str] = standardize_color) -> 'CompactColorLog':
+        log = cls()
+        for day, colors in data.items():
+            log.extend(day, colors, normalize)
+        return log
+
+    def colors(self, day: Optional[str] = None) -> ColorView:
+        """Zero-copy view of one day, or of the whole week when day is None."""
+        days = [day] if day is not None else list(self.days)
+        return ColorView(self.palette, [memoryview(self.days[name]) for name in days])
+
+    def save(self, path: str) -> None:
+        header = {
+            "palette": self.palette,
+            "days": [[day, len(buffer)] for day, buffer in self.days.items()]
+        }
+        # Write beside the target and swap it in, so saving a reloaded log over
+        # its own file never truncates the pages its days are mapped from
+        partial = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(partial, 'wb') as output:
+                output.write(json.dumps(header).encode() + b'\n')
+                for buffer in self.days.values():
+                    output.write(buffer)
+            os.replace(partial, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(partial)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> 'CompactColorLog':
+        with open(path, 'rb') as source:
+            mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        header = json.loads(mapped.readline())
+        log = cls(header["palette"])
+        log._mmap = mapped
+        view = memoryview(mapped)
+        offset = mapped.tell()
+        for day, length in header["days"]:
+            log.days[day] = view[offset:offset + length]
+            offset += length
+        return log
+
+    def close(self) -> None:
+        """
+        Unmap a reloaded log. Days still backed by the file are dropped; days
+        extended since the load are in-memory copies and stay. Views handed out
+        by colors() must be released first.
+        """
+        if self._mmap is None:
+            return
+        for day, buffer in list(self.days.items()):
+            if isinstance(buffer, memoryview):
+                buffer.release()
+                del self.days[day]
+        self._mmap.close()
+        self._mmap = None
+
 # 6. Save colors and frequencies to PostgreSQL
+POSTGRES_SETTINGS = {
+    "dbname": "your_database",
+    "user": "your_username",
+    "password": "your_password",
+    "host": "localhost",
+    "port": "5432"
+}
+
+_postgres_store = None
+_postgres_store_lock = threading.Lock()
+
+def get_postgres_store() -> 'PostgresColorStore':
+    """The process-wide store for POSTGRES_SETTINGS, with its pool opened on first use."""
+    global _postgres_store
+    with _postgres_store_lock:
+        if _postgres_store is None:
+            _postgres_store = PostgresColorStore(**POSTGRES_SETTINGS)
+            atexit.register(_postgres_store.close)
+        return _postgres_store
+
 def save_to_postgresql(colors: List[str]) -> None:
-    """Save the colors and their frequencies to PostgreSQL database."""
-    try:
-        # Connect to PostgreSQL database
-        conn = psycopg2.connect(
-            dbname="your_database",
-            user="your_username",
-            password="your_password",
-            host="localhost",
-            port="5432"
-        )
-        cursor = conn.cursor()
-        
-        # Create table if not exists
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS color_frequencies (
-                color VARCHAR(50) PRIMARY KEY,
-                frequency INTEGER
-            )
-        """)
-        
-        # Insert data
-        counter = collections.Counter(colors)
-        for color, frequency in counter.items():
-            cursor.execute(
-                "INSERT INTO color_frequencies (color, frequency) VALUES (%s, %s) ON CONFLICT (color) DO UPDATE SET frequency = %s",
-                (color, frequency, frequency)
+    """Save the colors and their frequencies to PostgreSQL database; database errors propagate."""
+    # One batched upsert over a pooled connection, replacing the stored frequencies
+    get_postgres_store().save_frequencies(collections.Counter(colors), merge=False)
+    print("Data saved to PostgreSQL successfully.")
+
+# Persistence layer for color frequencies: pooled, batched, incremental
+class ColorStore(abc.ABC):
+    """
+    Stores week-wide color frequencies in color_frequencies and per-day
+    frequencies in color_day_frequencies. save_frequencies writes a whole
+    Counter in one batched upsert; with merge=True the counts are added to
+    what is stored instead of replacing it.
+    """
+
+    @abc.abstractmethod
+    def ensure_schema(self) -> None:
+        """Create the frequency tables if they do not exist."""
+
+    @abc.abstractmethod
+    def save_frequencies(self, counts: Mapping[str, int], day: Optional[str] = None, merge: bool = True) -> None:
+        """Upsert counts for one day, or for the whole week when day is None."""
+
+    @abc.abstractmethod
+    def load_frequencies(self, day: Optional[str] = None) -> Dict[str, int]:
+        """Stored frequencies for one day, or for the whole week when day is None."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Release the connections held by the store."""
+
+    def save_days(self, data: Dict[str, List[str]], merge: bool = True) -> None:
+        """Save each day's counts and add them to the week totals."""
+        week = collections.Counter()
+        for day, colors in data.items():
+            counts = collections.Counter(colors)
+            self.save_frequencies(counts, day=day, merge=merge)
+            week.update(counts)
+        self.save_frequencies(week, merge=merge)
+
+class PostgresColorStore(ColorStore):
+    """
+    PostgreSQL backend with a thread-safe connection pool. Upserts go through
+    execute_values, one statement per page of rows. color_day_frequencies is
+    list-partitioned by day and partitions are created on first use.
+    """
+
+    def __init__(self, minconn: int = 1, maxconn: int = 5, **connect_kwargs):
+        # Imported here so the rest of the module (and the SQLite store) works without the driver
+        import psycopg2.extras
+        import psycopg2.pool
+        from psycopg2 import sql
+        self._execute_values = psycopg2.extras.execute_values
+        self._sql = sql
+        self.pool = psycopg2.pool.ThreadedConnectionPool(minconn, maxconn, **connect_kwargs)
+        self._partitions = set()
+        self.ensure_schema()
+
+    @contextlib.contextmanager
+    def connection(self):
+        """Borrow a pooled connection; commit on success, roll back on error."""
+        conn = self.pool.getconn()
+        try:
+            with conn:
+                yield conn
+        finally:
+            self.pool.putconn(conn)
+
+    def ensure_schema(self) -> None:
+        with self.connection() as conn, conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS color_frequencies (
+                    color VARCHAR(50) PRIMARY KEY,
+                    frequency BIGINT
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS color_day_frequencies (
+                    day VARCHAR(20),
+                    color VARCHAR(50),
+                    frequency BIGINT,
+                    PRIMARY KEY (day, color)
+                ) PARTITION BY LIST (day)
+            """)
+
+    def _ensure_partition(self, cursor, day: str) -> None:
+        if day in self._partitions:
+            return
+        # The readable part alone can collide ('Mon-1' and 'mon1'), so add a digest
+        # of the exact day; the name stays under PostgreSQL's 63-byte limit
+        readable = ''.join(c for c in day.lower() if c.isalnum())[:24]
+        digest = hashlib.sha1(day.encode()).hexdigest()[:12]
+        partition = f'color_day_frequencies_{readable}_{digest}'
+        sql = self._sql
+        cursor.execute(sql.SQL(
+            "CREATE TABLE IF NOT EXISTS {} PARTITION OF color_day_frequencies FOR VALUES IN ({})"
+        ).format(sql.Identifier(partition), sql.Literal(day)))
+        self._partitions.add(day)
+
+    def save_frequencies(self, counts: Mapping[str, int], day: Optional[str] = None, merge: bool = True) -> None:
+        if not counts:
+            return
+        with self.connection() as conn, conn.cursor() as cursor:
+            if day is None:
+                table, key, rows = 'color_frequencies', '(color)', list(counts.items())
+            else:
+                self._ensure_partition(cursor, day)
+                table, key, rows = 'color_day_frequencies', '(day, color)', [(day, c, n) for c, n in counts.items()]
+            new_value = f"{table}.frequency + EXCLUDED.frequency" if merge else "EXCLUDED.frequency"
+            columns = '(color, frequency)' if day is None else '(day, color, frequency)'
+            self._execute_values(
+                cursor,
+                f"INSERT INTO {table} {columns} VALUES %s "
+                f"ON CONFLICT {key} DO UPDATE SET frequency = {new_value}",
+                rows,
+                page_size=1000
             )
-        
-        # Commit changes and close connection
-        conn.commit()
-        cursor.close()
-        conn.close()
-        print("Data saved to PostgreSQL successfully.")
-    except Exception as e:
-        print(f"Database error: {e}")
+
+    def load_frequencies(self, day: Optional[str] = None) -> Dict[str, int]:
+        with self.connection() as conn, conn.cursor() as cursor:
+            if day is None:
+                cursor.execute("SELECT color, frequency FROM color_frequencies")
+            else:
+                cursor.execute("SELECT color, frequency FROM color_day_frequencies WHERE day = %s", (day,))
+            return dict(cursor.fetchall())
+
+    def close(self) -> None:
+        self.pool.closeall()
+
+class SQLiteColorStore(ColorStore):
+    """
+    SQLite stand-in with the same behaviour, for tests and local runs without
+    a PostgreSQL server. Per-day rows share one table keyed by (day, color).
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.ensure_schema()
+
+    def ensure_schema(self) -> None:
+        with self._lock, self.conn:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS color_frequencies (
+                    color VARCHAR(50) PRIMARY KEY,
+                    frequency INTEGER
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS color_day_frequencies (
+                    day VARCHAR(20),
+                    color VARCHAR(50),
+                    frequency INTEGER,
+                    PRIMARY KEY (day, color)
+                )
+            """)
+
+    def save_frequencies(self, counts: Mapping[str, int], day: Optional[str] = None, merge: bool = True) -> None:
+        if not counts:
+            return
+        new_value = "frequency + excluded.frequency" if merge else "excluded.frequency"
+        with self._lock, self.conn:
+            if day is None:
+                self.conn.executemany(
+                    "INSERT INTO color_frequencies (color, frequency) VALUES (?, ?) "
+                    f"ON CONFLICT (color) DO UPDATE SET frequency = {new_value}",
+                    counts.items()
+                )
+            else:
+                self.conn.executemany(
+                    "INSERT INTO color_day_frequencies (day, color, frequency) VALUES (?, ?, ?) "
+                    f"ON CONFLICT (day, color) DO UPDATE SET frequency = {new_value}",
+                    [(day, color, count) for color, count in counts.items()]
+                )
+
+    def load_frequencies(self, day: Optional[str] = None) -> Dict[str, int]:
+        with self._lock:
+            if day is None:
+                rows = self.conn.execute("SELECT color, frequency FROM color_frequencies")
+            else:
+                rows = self.conn.execute("SELECT color, frequency FROM color_day_frequencies WHERE day = ?", (day,))
+            return dict(rows.fetchall())
+
+    def close(self) -> None:
+        self.conn.close()
 
 # 7. BONUS: Recursive search algorithm
 def recursive_search(arr: List[int], target: int, start: int = 0, end: Optional[int] = None) -> int:
@@ -157,6 +866,94 @@ def recursive_search(arr: List[int], target: int, start: int = 0, end: Optional[
     # If target is greater than middle element, search right half
     return recursive_search(arr, target, mid + 1, end)
 
+# Iterative and batched search over sorted sequences
+def lower_bound(arr: Sequence[int], target: int, lo: int = 0) -> int:
+    """Index of the first element >= target (len(arr) if there is none)."""
+    return bisect.bisect_left(arr, target, lo)
+
+def upper_bound(arr: Sequence[int], target: int, lo: int = 0) -> int:
+    """Index of the first element > target (len(arr) if there is none)."""
+    return bisect.bisect_right(arr, target, lo)
+
+def binary_search(arr: Sequence[int], target: int) -> int:
+    """
+    Iterative version of recursive_search: index of target in the sorted
+    sequence (the first one if repeated), -1 if it is not there.
+    """
+    index = bisect.bisect_left(arr, target)
+    if index < len(arr) and arr[index] == target:
+        return index
+    return -1
+
+# Sorted queries at least this dense (arr elements per query) are answered by
+# one forward merge walk; sparser ones by bisecting from the previous hit
+MERGE_WALK_DENSITY = 4
+
+def _search_sorted(arr: Sequence[int], queries: Sequence[int]) -> List[int]:
+    size = len(arr)
+    results = []
+    index = 0
+    if size <= MERGE_WALK_DENSITY * len(queries):
+        for target in queries:
+            while index < size and arr[index] < target:
+                index += 1
+            results.append(index if index < size and arr[index] == target else -1)
+    else:
+        for target in queries:
+            index = bisect.bisect_left(arr, target, index)
+            results.append(index if index < size and arr[index] == target else -1)
+    return results
+
+def search_many(arr: Sequence[int], queries: Sequence[int], queries_sorted: bool = False) -> List[int]:
+    """
+    Look up many targets at once, returning their indices (-1 when missing).
+    With numpy this is one vectorized searchsorted. Otherwise the queries are
+    visited in sorted order (sorted here unless queries_sorted), so the search
+    only ever moves forward through arr: a linear merge walk when the queries
+    are dense, a bisect from the previous position when they are sparse.
+    """
+    if len(queries) == 0:
+        return []
+    if numpy is not None:
+        haystack = numpy.asarray(arr)
+        needles = numpy.asarray(queries)
+        indices = numpy.searchsorted(haystack, needles)
+        if not len(haystack):
+            return [-1] * len(needles)
+        hits = haystack[numpy.minimum(indices, len(haystack) - 1)] == needles
+        return numpy.where(hits & (indices < len(haystack)), indices, -1).tolist()
+    if queries_sorted:
+        return _search_sorted(arr, queries)
+    order = sorted(range(len(queries)), key=queries.__getitem__)
+    found = _search_sorted(arr, [queries[position] for position in order])
+    results = [-1] * len(queries)
+    for position, index in zip(order, found):
+        results[position] = index
+    return results
+
+def benchmark_search(size: int = 10 ** 7, query_count: int = 10 ** 6, seed: int = 0) -> Dict[str, float]:
+    """Seconds taken by recursive_search, binary_search and search_many for the same lookups."""
+    rng = random.Random(seed)
+    arr = array('q', range(0, 2 * size, 2))
+    # Half of the queries hit, half fall between elements
+    queries = sorted(rng.randrange(2 * size) for _ in range(query_count))
+
+    timings = {}
+    started = time.perf_counter()
+    expected = [recursive_search(arr, query) for query in queries]
+    timings["recursive_search"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    found = [binary_search(arr, query) for query in queries]
+    timings["binary_search"] = time.perf_counter() - started
+    assert found == expected
+
+    started = time.perf_counter()
+    found = search_many(arr, queries, queries_sorted=True)
+    timings["search_many"] = time.perf_counter() - started
+    assert found == expected
+    return timings
+
 # 8. Generate random 4-digit binary number and convert to base 10
 def generate_binary_and_convert() -> Dict[str, Union[str, int]]:
     """Generate random 4 digits of 0s and 1s and convert to base 10."""
@@ -172,17 +969,98 @@ def generate_binary_and_convert() -> Dict[str, Union[str, int]]:
         "decimal": decimal_value
     }
 
+# Batched random binary samples
+# Container typecodes for sample widths that fill whole machine integers
+_WIDTH_TYPECODES = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+
+class BinarySamples:
+    """
+    A batch of random width-bit numbers. values holds them packed as
+    integers; binary strings are only formatted when asked for.
+    """
+
+    def __init__(self, values: Union[array, List[int]], width: int):
+        self.values = values
+        self.width = width
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def binary(self, index: int) -> str:
+        return format(self.values[index], f'0{self.width}b')
+
+    def binaries(self) -> Iterator[str]:
+        pattern = f'0{self.width}b'
+        for value in self.values:
+            yield format(value, pattern)
+
+    def __getitem__(self, index: int) -> Dict[str, Union[str, int]]:
+        """One sample in the shape returned by generate_binary_and_convert."""
+        return {
+            "binary": self.binary(index),
+            "decimal": self.values[index]
+        }
+
+def generate_binary_samples(count: int, width: int = 4, seed: Optional[int] = None) -> BinarySamples:
+    """
+    Generate count random width-bit samples in bulk. Widths up to 8 bits and
+    whole 16/32/64-bit widths come from a single randbytes() call; other
+    widths fall back to one getrandbits() call per sample. The same seed
+    always gives the same samples.
+    """
+    if width < 1:
+        raise ValueError("width must be at least 1")
+    rng = random.Random(seed)
+    if width < 8:
+        # One random byte per sample, masked down to width bits at C speed
+        mask = bytes(value & ((1 << width) - 1) for value in range(256))
+        values = array('B', rng.randbytes(count).translate(mask))
+    elif width in _WIDTH_TYPECODES and array(_WIDTH_TYPECODES[width]).itemsize * 8 == width:
+        values = array(_WIDTH_TYPECODES[width])
+        values.frombytes(rng.randbytes(count * width // 8))
+    else:
+        values = [rng.getrandbits(width) for _ in range(count)]
+    return BinarySamples(values, width)
+
 # 9. Calculate sum of first 50 Fibonacci numbers
 def fibonacci_sum(n: int = 50) -> int:
     """Calculate the sum of first n Fibonacci numbers."""
+    # F(0) + F(1) + ... + F(n) = F(n + 2) - 1, so no list is needed
+    return fibonacci_sum_mod(n)
+
+def fibonacci_pair(n: int, modulus: Optional[int] = None) -> Tuple[int, int]:
+    """
+    (F(n), F(n + 1)) by fast doubling, in O(log n) steps:
+    F(2k) = F(k) * (2F(k + 1) - F(k)) and F(2k + 1) = F(k)^2 + F(k + 1)^2.
+    With a modulus every step is reduced, keeping the numbers small.
+    """
+    if n < 0:
+        raise ValueError("n must not be negative")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == '1' else (c, d)
+        if modulus is not None:
+            a %= modulus
+            b %= modulus
+    return a, b
+
+def fibonacci_number(n: int, modulus: Optional[int] = None) -> int:
+    """F(n), optionally modulo modulus."""
+    return fibonacci_pair(n, modulus)[0]
+
+def fibonacci_sum_mod(n: int, modulus: Optional[int] = None) -> int:
+    """F(0) + ... + F(n) as F(n + 2) - 1, optionally modulo modulus."""
     if n <= 0:
         return 0
-    
-    fib = [0, 1]
-    for i in range(2, n+1):
-        fib.append(fib[i-1] + fib[i-2])
-    
-    return sum(fib[:n+1])
+    total = fibonacci_pair(n + 1, modulus)[1] - 1
+    return total % modulus if modulus is not None else total
+
+@functools.lru_cache(maxsize=1024)
+def cached_fibonacci_sum(n: int, modulus: Optional[int] = None) -> int:
+    """fibonacci_sum_mod with an LRU cache for repeated queries."""
+    return fibonacci_sum_mod(n, modulus)
 
 # Process the binary sequence problem from the question
 def process_binary_sequence(input_sequence: str) -> str:
@@ -204,6 +1082,74 @@ def process_binary_sequence(input_sequence: str) -> str:
     
     return ''.join(output)
 
+# Bit-parallel run detection: the whole sequence is one integer, first bit most significant
+def _run_starts(bits: int, width: int, run_length: int) -> int:
+    """
+    Set bit i of the result when bit i and the run_length - 1 bits after it
+    (towards the least significant end) are all set. Doubling the covered span
+    each step needs only O(log run_length) big-integer ANDs.
+    """
+    if run_length < 1:
+        raise ValueError("run_length must be at least 1")
+    result = bits
+    span = 1
+    while span < run_length:
+        step = min(span, run_length - span)
+        result &= result << step
+        span += step
+    return result & ((1 << width) - 1)
+
+def process_binary_sequence_fast(input_sequence: str, run_length: int = 3) -> str:
+    """
+    Same rule as process_binary_sequence, for any run length, computed on the
+    sequence as a single integer instead of character by character.
+    """
+    if input_sequence.strip('01'):
+        raise ValueError("input must contain only 0s and 1s")
+    if not input_sequence:
+        return ''
+    width = len(input_sequence)
+    return format(_run_starts(int(input_sequence, 2), width, run_length), f'0{width}b')
+
+def process_packed_bits(data: bytes, run_length: int = 3) -> bytes:
+    """The run rule over packed bits (8 per byte, first bit most significant)."""
+    width = len(data) * 8
+    return _run_starts(int.from_bytes(data, 'big'), width, run_length).to_bytes(len(data), 'big')
+
+def stream_binary_sequence(chunks: Iterable[str], run_length: int = 3) -> Iterator[str]:
+    """
+    Apply the run rule to a sequence that arrives in chunks. The last
+    run_length - 1 characters of each chunk are carried over, because their
+    output depends on the next chunk; the output is identical to processing
+    the joined input in one go.
+    """
+    carry = ''
+    for chunk in chunks:
+        window = carry + chunk
+        ready = len(window) - (run_length - 1)
+        if ready <= 0:
+            carry = window
+            continue
+        yield process_binary_sequence_fast(window, run_length)[:ready]
+        carry = window[ready:]
+    if carry:
+        # Nothing follows, so no run can start in the tail
+        yield '0' * len(carry)
+
+def stream_packed_bits(chunks: Iterable[bytes], run_length: int = 3) -> Iterator[bytes]:
+    """Chunked version of process_packed_bits; whole bytes are carried between chunks."""
+    carry = b''
+    for chunk in chunks:
+        window = carry + chunk
+        ready = (len(window) * 8 - (run_length - 1)) // 8
+        if ready <= 0:
+            carry = window
+            continue
+        yield process_packed_bits(window, run_length)[:ready]
+        carry = window[ready:]
+    if carry:
+        yield process_packed_bits(carry, run_length)
+
 def main():
     # Standardize color data
     standardized_data = standardize_colors(color_data)
@@ -0,0 +1,203 @@
+import collections
+import os
+import random
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+import bincom
+from bincom import (
+    ColorAnalytics, ColorStatistics, ColorStore, CompactColorLog, SQLiteColorStore, color_data,
+    standardize_colors,
+)
+
+
+def mark(color):
+    # Not idempotent, so a second normalization pass shows up in the keys
+    return '*' + color
+
+
+class ColorStatisticsTests(unittest.TestCase):
+    def test_merge_adds_counts_without_normalizing_again(self):
+        first = ColorStatistics([('MONDAY', 'RED')], normalize=mark)
+        second = ColorStatistics([('TUESDAY', 'RED'), ('TUESDAY', 'BLUE')], normalize=mark)
+        first.merge(second)
+        self.assertEqual(first.counts, {'*RED': 2, '*BLUE': 1})
+        self.assertEqual(first.total, 3)
+
+    def test_analytics_normalize_each_observation_once(self):
+        analytics = ColorAnalytics(normalize=mark)
+        analytics.append_day('MONDAY', ['RED', 'RED'])
+        analytics.append_day('TUESDAY', ['BLUE'])
+        self.assertEqual(analytics.week.counts, {'*RED': 2, '*BLUE': 1})
+        self.assertEqual(analytics.range_statistics('MONDAY', 'TUESDAY').counts, {'*RED': 2, '*BLUE': 1})
+
+
+class ColorQuantileTests(unittest.TestCase):
+    def test_even_length_median_follows_the_tie_policy(self):
+        statistics = ColorStatistics()
+        statistics.add_counts({'RED': 2, 'BLUE': 2})
+        self.assertEqual(statistics.median(), 'BLUE')
+        self.assertEqual(statistics.median('high'), 'RED')
+        # An exact half goes to the low side
+        self.assertEqual(statistics.median('nearest'), 'BLUE')
+        self.assertEqual(bincom.get_median_color(['RED', 'BLUE', 'RED', 'BLUE']), 'BLUE')
+
+    def test_nearest_picks_the_closer_neighbour(self):
+        counts = {'BLUE': 1, 'GREEN': 1, 'RED': 1, 'WHITE': 1}
+        # Position 0.75 between BLUE and GREEN, 2.25 between RED and WHITE
+        self.assertEqual(bincom.color_quantile(counts, 0.25, 'nearest'), 'GREEN')
+        self.assertEqual(bincom.color_quantile(counts, 0.75, 'nearest'), 'RED')
+        self.assertEqual(bincom.color_quantiles(counts, [0, 1]), {0: 'BLUE', 1: 'WHITE'})
+
+    def test_ties_do_not_matter_inside_one_color(self):
+        for tie in bincom.QUANTILE_TIES:
+            self.assertEqual(bincom.color_quantile({'BLUE': 1, 'RED': 3}, 0.5, tie), 'RED')
+            self.assertEqual(bincom.color_quantile({'BLUE': 1, 'RED': 1, 'WHITE': 1}, 0.5, tie), 'RED')
+
+    def test_rejects_bad_arguments(self):
+        for q, tie, counts in ((1.5, 'low', {'RED': 1}), (0.5, 'middle', {'RED': 1}), (0.5, 'low', {})):
+            with self.assertRaises(ValueError):
+                bincom.color_quantile(counts, q, tie)
+
+
+class SQLiteColorStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.store = SQLiteColorStore()
+        self.addCleanup(self.store.close)
+
+    def test_save_days_stores_day_and_week_totals(self):
+        data = standardize_colors(color_data)
+        self.store.save_days(data)
+        self.assertEqual(self.store.load_frequencies('MONDAY')['BLUE'], data['MONDAY'].count('BLUE'))
+        self.assertEqual(
+            self.store.load_frequencies()['BLUE'],
+            sum(colors.count('BLUE') for colors in data.values()),
+        )
+
+    def test_merge_adds_and_replace_overwrites(self):
+        self.store.save_frequencies({'RED': 2}, day='MONDAY')
+        self.store.save_frequencies({'RED': 3, 'BLUE': 1}, day='MONDAY')
+        self.assertEqual(self.store.load_frequencies('MONDAY'), {'RED': 5, 'BLUE': 1})
+        self.store.save_frequencies({'RED': 1}, day='MONDAY', merge=False)
+        self.assertEqual(self.store.load_frequencies('MONDAY'), {'RED': 1, 'BLUE': 1})
+        self.assertEqual(self.store.load_frequencies('TUESDAY'), {})
+
+    def test_store_interface_is_abstract(self):
+        with self.assertRaises(TypeError):
+            ColorStore()
+
+
+
+class CompactColorLogTests(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'colors.log')
+        self.data = standardize_colors(color_data)
+
+    def load(self):
+        log = CompactColorLog.load(self.path)
+        self.addCleanup(log.close)
+        return log
+
+    def test_save_and_load_round_trip(self):
+        CompactColorLog.from_data(self.data).save(self.path)
+        log = self.load()
+        self.assertEqual(list(log.days), list(self.data))
+        for day, colors in self.data.items():
+            self.assertEqual(list(log.colors(day)), colors)
+        self.assertEqual(log.colors().counts(), collections.Counter(color for colors in self.data.values() for color in colors))
+
+    def test_extend_reloaded_log_and_save_over_its_own_file(self):
+        CompactColorLog.from_data(self.data).save(self.path)
+        log = self.load()
+        log.extend('MONDAY', ['RED', 'PURPLE'])
+        log.extend('SATURDAY', ['BLUE'])
+        log.save(self.path)
+        # The mapped days still read back after their file was replaced
+        self.assertEqual(list(log.colors('TUESDAY')), self.data['TUESDAY'])
+
+        reloaded = self.load()
+        self.assertEqual(list(reloaded.colors('MONDAY')), self.data['MONDAY'] + ['RED', 'PURPLE'])
+        self.assertEqual(list(reloaded.colors('SATURDAY')), ['BLUE'])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['colors.log'])
+
+    def test_close_drops_mapped_days_and_keeps_extended_ones(self):
+        CompactColorLog.from_data(self.data).save(self.path)
+        log = self.load()
+        log.extend('MONDAY', ['RED'])
+        view = log.colors('TUESDAY')
+        view.segments[0].release()
+        log.close()
+        self.assertEqual(list(log.days), ['MONDAY'])
+        self.assertEqual(list(log.colors('MONDAY')), self.data['MONDAY'] + ['RED'])
+        # Closing again, or closing a log that was never mapped, does nothing
+        log.close()
+        CompactColorLog().close()
+
+
+class SearchManyTests(unittest.TestCase):
+    def check(self, arr, queries):
+        expected = [bincom.binary_search(arr, query) for query in queries]
+        self.assertEqual(bincom.search_many(arr, queries), expected)
+        ordered = sorted(queries)
+        self.assertEqual(
+            bincom.search_many(arr, ordered, queries_sorted=True),
+            [bincom.binary_search(arr, query) for query in ordered],
+        )
+
+    def test_matches_binary_search_for_dense_and_sparse_queries(self):
+        rng = random.Random(0)
+        # Repeated elements: the first occurrence is reported, as binary_search does
+        arr = array('q', sorted(rng.randrange(300) for _ in range(200)))
+        for count in (1, 10, 1000):
+            queries = [rng.randrange(-5, 305) for _ in range(count)]
+            self.check(arr, queries)
+            with mock.patch.object(bincom, 'numpy', None):
+                self.check(arr, queries)
+
+    def test_empty_inputs(self):
+        with mock.patch.object(bincom, 'numpy', None):
+            self.assertEqual(bincom.search_many(array('q'), [1, 2]), [-1, -1])
+            self.assertEqual(bincom.search_many(array('q', [1]), []), [])
+        self.assertEqual(bincom.search_many(array('q'), [1, 2]), [-1, -1])
+
+
+
+def split(sequence, rng):
+    # Random cut points, including empty chunks and chunks shorter than a run
+    cuts = sorted(rng.randrange(len(sequence) + 1) for _ in range(rng.randrange(8)))
+    bounds = [0] + cuts + [len(sequence)]
+    return [sequence[start:end] for start, end in zip(bounds, bounds[1:])]
+
+
+class StreamRunTests(unittest.TestCase):
+    def test_stream_matches_one_shot_across_chunk_splits(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            sequence = ''.join(rng.choice('01') for _ in range(rng.randrange(40)))
+            chunks = split(sequence, rng)
+            self.assertEqual(''.join(bincom.stream_binary_sequence(chunks)),
+                             bincom.process_binary_sequence(sequence), chunks)
+            for run_length in (1, 2, 5):
+                self.assertEqual(''.join(bincom.stream_binary_sequence(chunks, run_length)),
+                                 bincom.process_binary_sequence_fast(sequence, run_length), chunks)
+
+    def test_run_straddling_chunks_is_found(self):
+        self.assertEqual(list(bincom.stream_binary_sequence(['0', '1', '1', '1', '0'])),
+                         ['0', '1', '0', '00'])
+
+    def test_packed_stream_matches_one_shot_across_chunk_splits(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            data = bytes(rng.choice((0x00, 0x0F, 0x80, 0xFF, rng.randrange(256))) for _ in range(rng.randrange(12)))
+            chunks = split(data, rng)
+            for run_length in (3, 9, 17):
+                self.assertEqual(b''.join(bincom.stream_packed_bits(chunks, run_length)),
+                                 bincom.process_packed_bits(data, run_length), chunks)
+
+
+if __name__ == '__main__':
+    unittest.main()